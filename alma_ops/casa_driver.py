@@ -9,11 +9,100 @@ Usage:
 ------
 # called via the following command
 casa --logfile "$CASA_LOGFILE_PATH" -c "$CASA_DRIVER_SCRIPT_PATH" --json-payload "$JSON_PAYLOAD_PATH"
-"""
-# ruff: noqa: F821
 
+Payloads ending in `.ndjson` hold one JSON object per line (a metadata header
+line, then one line per task) and are parsed and executed line by line. Any
+other payload is read as a single JSON document with a "tasks" list.
+"""
 import argparse
+import builtins
 import json
+import mmap
+import os
+
+try:
+    import orjson
+except ImportError:  # CASA's bundled python may not ship orjson
+    orjson = None
+
+
+def load_json_payload(path: str) -> dict:
+    """Loads the json payload, via orjson on a memory-mapped read when available.
+
+    Parameters
+    ----------
+    path : str
+        Path to the json payload file.
+
+    Returns
+    -------
+    dict
+        The parsed json payload.
+    """
+    if orjson is None:
+        with open(path, "r") as f:
+            return json.load(f)
+
+    # orjson parses straight from the mapped buffer, skipping a bytes copy
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+            return orjson.loads(buf)
+    finally:
+        os.close(fd)
+
+
+def iter_ndjson_tasks(path: str):
+    """Yields tasks from an NDJSON payload one line at a time.
+
+    Lines without a "task" key (e.g., the metadata header) are skipped, so the
+    first task can run before the rest of the file has been read.
+
+    Parameters
+    ----------
+    path : str
+        Path to the NDJSON payload file.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = loads(line)
+            if "task" in record:
+                yield record
+
+
+# casa task name -> (default kwargs, allowed payload keys); payload keys override
+# defaults, keys outside the allowed set are not forwarded. The tasks themselves
+# only exist inside CASA, so they are looked up by name when run.
+DISPATCH = {
+    "split": (
+        {"datacolumn": "data"},
+        frozenset({"vis", "outputvis", "intent", "field", "spw", "datacolumn"}),
+    ),
+    "listobs": (
+        {"verbose": True},
+        frozenset({"vis", "listfile", "verbose"}),
+    ),
+}
+
+
+def _casa_task(name: str):
+    """Resolves a casa task the way a bare name would: module globals, then builtins."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return getattr(builtins, name)
+
+
+def run_task(task: dict):
+    """Executes a single casa task from the payload, forwarding its allowed keys."""
+    name = task["task"]
+    defaults, allowed = DISPATCH[name]
+    _casa_task(name)(**{**defaults, **{k: v for k, v in task.items() if k in allowed}})
+
 
 # =====================================================================
 # CLI Entry
@@ -26,26 +115,12 @@ if __name__ == "__main__":
     parser.add_argument("--json-payload", required=True)
     args = parser.parse_args()
 
-    # opens the json payload file
-    with open(args.json_payload, "r") as f:
-        config = json.load(f)
+    # stream NDJSON payloads task by task; load plain JSON payloads whole
+    if args.json_payload.endswith(".ndjson"):
+        tasks = iter_ndjson_tasks(args.json_payload)
+    else:
+        tasks = load_json_payload(args.json_payload)["tasks"]
 
     # executes all tasks given
-    for task in config["tasks"]:
-        name = task["task"]
-
-        if name == "split":
-            split(
-                vis=task["vis"],
-                outputvis=task["outputvis"],
-                intent=task["intent"],
-                spw=task["spw"],
-                datacolumn=task.get("datacolumn", "data"),
-            )
-
-        elif name == "listobs":
-            listobs(
-                vis=task["vis"],
-                listfile=task["listfile"],
-                verbose=task.get("verbose", True),
-            )
+    for task in tasks:
+        run_task(task)
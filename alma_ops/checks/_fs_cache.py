@@ -0,0 +1,83 @@
+# alma_ops/checks/_fs_cache.py
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+
+def _scan_dir(directory: str) -> tuple[bool, list[str], set[str]]:
+    """Single scandir pass returning (exists, sorted *.ms names, all entry names)."""
+    try:
+        with os.scandir(directory) as it:
+            names = {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return False, [], set()
+
+    # mirror Path.glob("*.ms"), which skips hidden entries
+    ms_names = sorted(n for n in names if n.endswith(".ms") and not n.startswith("."))
+    return True, ms_names, names
+
+
+def scan_mous(mous_dir: str | Path) -> dict:
+    """
+    Scan a MOUS directory and its splits/ subdirectory exactly once each.
+
+    Returns a dict with:
+      - "mous_dir": the scanned MOUS directory, as a str
+      - "exists" / "splits_exists": whether each directory is present
+      - "raw_ms" / "split_ms": sorted full paths of *.ms entries
+      - "split_ms_names": the bare DirEntry names matching "split_ms"
+      - "raw_listobs" / "split_listobs": sets of *.listobs.txt entry names
+    """
+    mous_dir = str(mous_dir)
+    splits_dir = os.path.join(mous_dir, "splits")
+
+    exists, raw_ms, raw_names = _scan_dir(mous_dir)
+    splits_exists, split_ms, split_names = _scan_dir(splits_dir)
+
+    return {
+        "mous_dir": mous_dir,
+        "exists": exists,
+        "splits_exists": splits_exists,
+        "raw_ms": [os.path.join(mous_dir, n) for n in raw_ms],
+        "split_ms": [os.path.join(splits_dir, n) for n in split_ms],
+        "split_ms_names": split_ms,
+        "raw_listobs": {n for n in raw_names if n.endswith(".listobs.txt")},
+        "split_listobs": {n for n in split_names if n.endswith(".listobs.txt")},
+    }
+
+
+class MousScanCache:
+    """
+    LRU-memoized scan_mous() results keyed by str(mous_dir).
+
+    Build one instance and pass it to each checker so back-to-back checks
+    reuse the same directory listing instead of re-walking the tree. Safe to
+    share between the checkers' worker threads.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def scan(self, mous_dir: str | Path) -> dict:
+        key = str(mous_dir)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        # scan outside the lock so worker threads overlap their filesystem I/O
+        result = scan_mous(key)
+
+        with self._lock:
+            self._entries[key] = result
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,37 @@
+# alma_ops/checks/_parallel.py
+
+from concurrent.futures import ThreadPoolExecutor
+from alma_ops.db import db_transaction
+
+# cap on concurrent filesystem checks (NFS/ARC mounts saturate beyond this)
+MAX_WORKERS = 32
+
+
+def map_mous(fn, items) -> list:
+    """Run fn over items on a thread pool, preserving input order."""
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as ex:
+        return list(ex.map(fn, items))
+
+
+def apply_writes(conn, writes):
+    """
+    Apply deferred database writes on the calling thread in one transaction.
+
+    Checkers run their per-MOUS bodies in worker threads but hand back their
+    mark_* calls as zero-argument callables (or None), since a sqlite3
+    connection must only be used from the thread that created it.
+
+    All writes share a single commit, so a full check run costs one fsync
+    rather than one per MOUS.
+    """
+    pending = [w for w in writes if w is not None]
+    if not pending:
+        return
+
+    with db_transaction(conn):
+        for write in pending:
+            write()
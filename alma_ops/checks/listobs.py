@@ -1,14 +1,28 @@
 # alma_ops/checks/listobs.py
 
-from pathlib import Path
-import json
+from functools import lru_cache
 import os
+from alma_ops.checks._fs_cache import MousScanCache
+from alma_ops.checks._parallel import map_mous
 from alma_ops.logging import get_logger
 from alma_ops.utils import to_dir_mous_id
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson comes with prefect; fall back to stdlib otherwise
+    from json import loads as _json_loads
+
 log = get_logger(__name__)
 
-def check_for_listobs(conn, base_dir: str, verbose: bool = False):
+@lru_cache(maxsize=4096)
+def _parse_asdm_paths(blob: str) -> tuple[str, ...]:
+    """Parse an asdm_paths JSON blob once; repeated blobs hit the cache."""
+    return tuple(_json_loads(blob))
+
+
+def check_for_listobs(
+    conn, base_dir: str, verbose: bool = False, fs_cache: MousScanCache | None = None
+):
     """
     Check that listobs products exist for:
 
@@ -27,90 +41,118 @@ def check_for_listobs(conn, base_dir: str, verbose: bool = False):
     Special case:
       If split listobs exist but some raw listobs are missing, we append
       a warning note (this likely indicates a workflow hiccup).
+
+    Pass a shared ``fs_cache`` to reuse directory scans across checkers.
     """
+    fs_cache = fs_cache or MousScanCache()
     cursor = conn.cursor()
     cursor.execute("SELECT mous_id, asdm_paths FROM mous")
     rows = cursor.fetchall()
 
-    results = []
+    base = str(base_dir)
 
-    for row in rows:
+    def _check_one(row):
         mous_id = row["mous_id"]
-        asdm_paths_json = row["asdm_paths"]
-
-        # -----------------------------
-        # RAW ASDM listobs expectations
-        # -----------------------------
-        raw_asdm_paths = []
-        if asdm_paths_json:
-            try:
-                raw_asdm_paths = json.loads(asdm_paths_json)
-            except Exception:
-                if verbose:
-                    log.warning(f"[{mous_id}] Could not parse asdm_paths JSON; skipping raw listobs checks.")
-
-        expected_raw_listobs = [p + ".listobs.txt" for p in raw_asdm_paths]
-        present_raw_listobs = [p for p in expected_raw_listobs if os.path.exists(p)]
-        missing_raw_listobs = [p for p in expected_raw_listobs if not os.path.exists(p)]
-        
-        # -----------------------------
-        # SPLIT MS listobs expectations
-        # -----------------------------
-        mous_dir = Path(base_dir) / to_dir_mous_id(mous_id)
-        splits_dir = mous_dir / "splits"
-
-        split_ms_files = list(splits_dir.glob("*.ms")) if splits_dir.exists() else []
-        expected_split_listobs = [
-            ms.with_suffix(ms.suffix + ".listobs.txt") for ms in split_ms_files
-        ]
-        present_split_listobs = [str(p) for p in expected_split_listobs if p.exists()]
-        missing_split_listobs = [str(p) for p in expected_split_listobs if not p.exists()]
-
-        # -----------------------------
-        # Determine overall status
-        # -----------------------------
-        any_expected = bool(expected_raw_listobs or expected_split_listobs)
-
-        if not any_expected:
-            # We don't actually know what to expect here (no asdm_paths, no splits)
-            status = "no-data"
-            note = "No ASDM paths in DB and no split MS on disk; no expected listobs."
+        scan = fs_cache.scan(os.path.join(base, to_dir_mous_id(mous_id)))
+        return _check_listobs_one(mous_id, row["asdm_paths"], scan, verbose=verbose)
+
+    # read-only check, so every MOUS can be checked in parallel
+    return map_mous(_check_one, rows)
+
+
+def _check_listobs_one(
+    mous_id: str, asdm_paths_json: str | None, scan: dict, verbose: bool = False
+) -> dict:
+    """Listobs check for a single MOUS, given its cached directory scan."""
+
+    # -----------------------------
+    # RAW ASDM listobs expectations
+    # -----------------------------
+    raw_asdm_paths = []
+    if asdm_paths_json:
+        try:
+            raw_asdm_paths = _parse_asdm_paths(asdm_paths_json)
+        except Exception:
             if verbose:
-                log.info(f"[{mous_id}] {note}")
+                log.warning(f"[{mous_id}] Could not parse asdm_paths JSON; skipping raw listobs checks.")
+
+    expected_raw_listobs = [p + ".listobs.txt" for p in raw_asdm_paths]
+
+    # raw ASDMs are recorded from the MOUS directory itself, whose cached scan
+    # already holds every *.listobs.txt name; only paths recorded elsewhere
+    # need a stat
+    mous_dir = scan["mous_dir"]
+    raw_listobs_names = scan["raw_listobs"]
+    present_raw_listobs, missing_raw_listobs = [], []
+    for p in expected_raw_listobs:
+        directory, name = os.path.split(p)
+        if directory == mous_dir:
+            present = name in raw_listobs_names
+        else:
+            present = os.path.exists(p)
 
+        if present:
+            present_raw_listobs.append(p)
+        else:
+            missing_raw_listobs.append(p)
+
+    # -----------------------------
+    # SPLIT MS listobs expectations
+    # -----------------------------
+    # the cached scandir of splits/ already holds every entry name, so each
+    # expected listobs is a name lookup with no extra stat
+    split_listobs_names = scan["split_listobs"]
+    expected_split_listobs, present_split_listobs, missing_split_listobs = [], [], []
+    for name, ms_path in zip(scan["split_ms_names"], scan["split_ms"]):
+        listobs_path = ms_path + ".listobs.txt"
+        expected_split_listobs.append(listobs_path)
+        if name + ".listobs.txt" in split_listobs_names:
+            present_split_listobs.append(listobs_path)
         else:
-            if not missing_raw_listobs and not missing_split_listobs:
-                # Everything we expect is present
-                status = "ok"
-                note = (
-                    f"All listobs present "
-                    f"({len(present_raw_listobs)} raw, {len(present_split_listobs)} split)."
-                )
-                if verbose:
-                    log.info(f"✅ [{mous_id}] {note}")
-            else:
-                # Something is missing
-                pieces = []
-                if missing_raw_listobs:
-                    pieces.append(f"{len(missing_raw_listobs)} raw listobs missing")
-                if missing_split_listobs:
-                    pieces.append(f"{len(missing_split_listobs)} split listobs missing")
-
-                note = "; ".join(pieces)
-                status = "missing"
-
-                # Special diagnostic: we DO have split listobs, but some raw listobs missing
-                if present_split_listobs and missing_raw_listobs:
-                    note += "; split listobs present but raw listobs missing"
-
-                if verbose:
-                    log.warning(f"⚠️ [{mous_id}] {note}")
-
-        results.append({
-            "mous_id": mous_id,
-            "status": status,
-            "note": note,
-        })
-
-    return results
+            missing_split_listobs.append(listobs_path)
+
+    # -----------------------------
+    # Determine overall status
+    # -----------------------------
+    any_expected = bool(expected_raw_listobs or expected_split_listobs)
+
+    if not any_expected:
+        # We don't actually know what to expect here (no asdm_paths, no splits)
+        status = "no-data"
+        note = "No ASDM paths in DB and no split MS on disk; no expected listobs."
+        if verbose:
+            log.info(f"[{mous_id}] {note}")
+
+    else:
+        if not missing_raw_listobs and not missing_split_listobs:
+            # Everything we expect is present
+            status = "ok"
+            note = (
+                f"All listobs present "
+                f"({len(present_raw_listobs)} raw, {len(present_split_listobs)} split)."
+            )
+            if verbose:
+                log.info(f"✅ [{mous_id}] {note}")
+        else:
+            # Something is missing
+            pieces = []
+            if missing_raw_listobs:
+                pieces.append(f"{len(missing_raw_listobs)} raw listobs missing")
+            if missing_split_listobs:
+                pieces.append(f"{len(missing_split_listobs)} split listobs missing")
+
+            note = "; ".join(pieces)
+            status = "missing"
+
+            # Special diagnostic: we DO have split listobs, but some raw listobs missing
+            if present_split_listobs and missing_raw_listobs:
+                note += "; split listobs present but raw listobs missing"
+
+            if verbose:
+                log.warning(f"⚠️ [{mous_id}] {note}")
 
+    return {
+        "mous_id": mous_id,
+        "status": status,
+        "note": note,
+    }
@@ -1,10 +1,12 @@
 # alma_ops/checks/raw_asdms.py
 
-from pathlib import Path
-from datetime import datetime
+import os
+from functools import partial
+from alma_ops.checks._fs_cache import MousScanCache
+from alma_ops.checks._parallel import apply_writes, map_mous
 from alma_ops.logging import get_logger
 from alma_ops.utils import to_dir_mous_id
-from alma_ops.db import db_fetch_all, get_mous_expected_asdms
+from alma_ops.db import get_all_expected_asdms
 from alma_ops.downloads.status import (
     mark_download_success,
     mark_download_partial,
@@ -13,96 +15,131 @@ from alma_ops.downloads.status import (
 
 log = get_logger(__name__)
 
-def check_for_raw_asdms(conn, dataset_dir: str, verbose: bool = False, dry_run: bool = False):
+def check_for_raw_asdms(
+    conn,
+    dataset_dir: str,
+    verbose: bool = False,
+    dry_run: bool = False,
+    fs_cache: MousScanCache | None = None,
+):
     """
     Check raw ASDM .ms directories in DB_PATH/<mous_dir>.
     Falls back gracefully if no ASDMs exist (splits may still be valid).
     Returns a list of status dictionaries.
+
+    Pass a shared ``fs_cache`` to reuse directory scans across checkers.
+    """
+    fs_cache = fs_cache or MousScanCache()
+
+    # one query for every MOUS and its expected ASDM count
+    expected_by_mous = get_all_expected_asdms(conn)
+
+    base = str(dataset_dir)
+
+    def _check_one(item):
+        mous_id, expected = item
+        mous_dir = os.path.join(base, to_dir_mous_id(mous_id))
+        return _check_raw_asdms_one(
+            conn,
+            mous_id,
+            mous_dir,
+            fs_cache.scan(mous_dir),
+            expected,
+            verbose=verbose,
+            dry_run=dry_run,
+        )
+
+    # filesystem checks run in parallel; DB writes are applied afterwards
+    outcomes = map_mous(_check_one, expected_by_mous.items())
+    apply_writes(conn, [write for _, write in outcomes])
+
+    return [result for result, _ in outcomes]
+
+
+def _check_raw_asdms_one(
+    conn,
+    mous_id: str,
+    mous_dir: str,
+    scan: dict,
+    expected: int,
+    verbose: bool = False,
+    dry_run: bool = False,
+) -> tuple[dict, partial | None]:
+    """Raw ASDM check for a single MOUS, given its cached directory scan.
+
+    Returns the result dict and the deferred status write (None if no write).
     """
 
-    cursor = conn.cursor()
-    cursor.execute("SELECT mous_id FROM mous")
-    mous_ids = [r[0] for r in cursor.fetchall()]
-
-    results = []
-
-    for mous_id in mous_ids:
-        mous_dir = Path(dataset_dir) / to_dir_mous_id(mous_id)
-
-        # If no directory exists at all
-        if not mous_dir.exists():
-            results.append({
-                "mous_id": mous_id,
-                "status": "missing",
-                "note": "MOUS directory missing",
-            })
-            continue
-
-        # Raw ASDM directories (*.ms)
-        raw_asdms = sorted(str(p) for p in mous_dir.glob("*.ms"))
-        found = len(raw_asdms)
-        expected = get_mous_expected_asdms(conn, mous_id)
-
-        if found == 0:
-            results.append({
-                "mous_id": mous_id,
-                "status": "none",
-                "note": "No raw ASDMs found (may be split-only dataset).",
-            })
-            continue
-
-        if found == expected:
-            note = f"Raw ASDMs OK ({found}/{expected})"
-            if verbose:
-                log.info(f"✅ [{mous_id}] {note}")
-
-            if not dry_run:
-                mark_download_success(
-                    conn,
-                    mous_id,
-                    download_path=str(mous_dir),
-                    asdm_paths=raw_asdms,
-                )
-
-            results.append({
-                "mous_id": mous_id,
-                "status": "ok",
-                "note": note,
-            })
-
-        elif found < expected:
-            note = f"Partial: {found}/{expected} raw ASDMs found"
-            if verbose:
-                log.warning(f"⚠️ [{mous_id}] {note}")
-
-            if not dry_run:
-                mark_download_partial(
-                    conn,
-                    mous_id,
-                    download_path=str(mous_dir),
-                    asdm_paths=raw_asdms,
-                    expected_count=expected,
-                )
-
-            results.append({
-                "mous_id": mous_id,
-                "status": "partial",
-                "note": note,
-            })
-
-        else:
-            # More ASDMs than expected — rare but possible if manually added
-            note = f"Found MORE ASDMs than expected ({found}/{expected})"
-            if verbose:
-                log.error(f"❌ [{mous_id}] {note}")
-
-            if not dry_run:
-                mark_download_failure(conn, mous_id, Exception(note))
-
-            results.append({
-                "mous_id": mous_id,
-                "status": "unexpected",
-                "note": note,
-            })
-
-    return results
\ No newline at end of file
+    # If no directory exists at all
+    if not scan["exists"]:
+        return {
+            "mous_id": mous_id,
+            "status": "missing",
+            "note": "MOUS directory missing",
+        }, None
+
+    # Raw ASDM directories (*.ms)
+    raw_asdms = scan["raw_ms"]
+    found = len(raw_asdms)
+
+    if found == 0:
+        return {
+            "mous_id": mous_id,
+            "status": "none",
+            "note": "No raw ASDMs found (may be split-only dataset).",
+        }, None
+
+    if found == expected:
+        note = f"Raw ASDMs OK ({found}/{expected})"
+        if verbose:
+            log.info(f"✅ [{mous_id}] {note}")
+
+        write = None if dry_run else partial(
+            mark_download_success,
+            conn,
+            mous_id,
+            download_path=mous_dir,
+            asdm_paths=raw_asdms,
+        )
+
+        return {
+            "mous_id": mous_id,
+            "status": "ok",
+            "note": note,
+        }, write
+
+    elif found < expected:
+        note = f"Partial: {found}/{expected} raw ASDMs found"
+        if verbose:
+            log.warning(f"⚠️ [{mous_id}] {note}")
+
+        write = None if dry_run else partial(
+            mark_download_partial,
+            conn,
+            mous_id,
+            download_path=mous_dir,
+            asdm_paths=raw_asdms,
+            expected_count=expected,
+        )
+
+        return {
+            "mous_id": mous_id,
+            "status": "partial",
+            "note": note,
+        }, write
+
+    else:
+        # More ASDMs than expected — rare but possible if manually added
+        note = f"Found MORE ASDMs than expected ({found}/{expected})"
+        if verbose:
+            log.error(f"❌ [{mous_id}] {note}")
+
+        write = None if dry_run else partial(
+            mark_download_failure, conn, mous_id, Exception(note)
+        )
+
+        return {
+            "mous_id": mous_id,
+            "status": "unexpected",
+            "note": note,
+        }, write
@@ -0,0 +1,65 @@
+# alma_ops/checks/run_all.py
+
+import os
+from alma_ops.checks._fs_cache import scan_mous
+from alma_ops.checks._parallel import apply_writes, map_mous
+from alma_ops.checks.listobs import _check_listobs_one
+from alma_ops.checks.raw_asdms import _check_raw_asdms_one
+from alma_ops.checks.split_products import _check_split_products_one
+from alma_ops.db import db_fetch_all, get_all_unique_target_names
+from alma_ops.utils import to_dir_mous_id
+
+
+def run_all_checks(conn, dataset_dir: str, verbose: bool = False, dry_run: bool = False):
+    """
+    Run the raw ASDM, split product and listobs checks in one fused pass.
+
+    Each MOUS row is read once, and each MOUS directory (plus its splits/)
+    is scanned once; the three checks all decide from that same listing.
+
+    Returns a dict with "raw", "splits" and "listobs" result lists, in the
+    same shape as check_for_raw_asdms / check_for_split_products /
+    check_for_listobs respectively.
+    """
+    rows = db_fetch_all(conn, "SELECT mous_id, asdm_paths, num_asdms FROM mous")
+    targets_by_mous = get_all_unique_target_names(conn)
+
+    base = str(dataset_dir)
+
+    def _check_one(row):
+        mous_id, asdm_paths_json, num_asdms = row
+        mous_dir = os.path.join(base, to_dir_mous_id(mous_id))
+        scan = scan_mous(mous_dir)
+
+        raw = _check_raw_asdms_one(
+            conn,
+            mous_id,
+            mous_dir,
+            scan,
+            int(num_asdms or 0),
+            verbose=verbose,
+            dry_run=dry_run,
+        )
+        splits = _check_split_products_one(
+            conn,
+            mous_id,
+            scan,
+            targets_by_mous.get(mous_id, []),
+            verbose=verbose,
+            dry_run=dry_run,
+        )
+        listobs = _check_listobs_one(mous_id, asdm_paths_json, scan, verbose=verbose)
+        return raw, splits, listobs
+
+    # filesystem checks run in parallel; DB writes are applied afterwards
+    outcomes = map_mous(_check_one, rows)
+    apply_writes(
+        conn,
+        [write for raw, splits, _ in outcomes for _, write in (raw, splits)],
+    )
+
+    return {
+        "raw": [raw[0] for raw, _, _ in outcomes],
+        "splits": [splits[0] for _, splits, _ in outcomes],
+        "listobs": [listobs for _, _, listobs in outcomes],
+    }
@@ -1,79 +1,115 @@
 # alma_ops/checks/split_products.py
 
-from pathlib import Path
-from datetime import datetime
+import os
+from functools import partial
+from alma_ops.checks._fs_cache import MousScanCache
+from alma_ops.checks._parallel import apply_writes, map_mous
 from alma_ops.logging import get_logger
 from alma_ops.utils import to_dir_mous_id
-from alma_ops.db import get_unique_target_names
+from alma_ops.db import get_all_unique_target_names
 from alma_ops.downloads.status import mark_split_complete, mark_split_partial, mark_split_missing
 
 log = get_logger(__name__)
 
-def check_for_split_products(conn, dataset_dir: str, verbose: bool = False, dry_run: bool = False):
+def check_for_split_products(
+    conn,
+    dataset_dir: str,
+    verbose: bool = False,
+    dry_run: bool = False,
+    fs_cache: MousScanCache | None = None,
+):
+    fs_cache = fs_cache or MousScanCache()
     cursor = conn.cursor()
     cursor.execute("SELECT mous_id FROM mous")
     mous_ids = [r[0] for r in cursor.fetchall()]
 
-    results = []
-
-    for mous_id in mous_ids:
-        mous_dir = Path(dataset_dir) / to_dir_mous_id(mous_id)
-        splits_dir = mous_dir / "splits"
-
-        if not splits_dir.exists():
-            results.append({
-                "mous_id": mous_id,
-                "status": "none",
-                "note": "No split directory",
-            })
-            continue
-
-        split_products = sorted(str(p) for p in splits_dir.glob("*.ms"))
-        found = len(split_products)
-
-        targets = get_unique_target_names(conn, mous_id)
-        missing_targets = [
-            t for t in targets if not any(t in Path(p).stem for p in split_products)
-        ]
-
-        if len(split_products) == 0:
-
-            if not dry_run:
-                mark_split_missing(conn, mous_id)
-
-            results.append({
-                "mous_id": mous_id,
-                "status": "none",
-                "note": "Split directory exists but contains no .ms files",
-            })
-            continue
-
-        if missing_targets:
-            note = f"Missing split datasets for: {', '.join(missing_targets)}"
-            if verbose:
-                log.warning(f"⚠️ [{mous_id}] {note}")
-
-            if not dry_run:
-                mark_split_partial(conn, mous_id, split_products, missing_targets)
-
-            results.append({
-                "mous_id": mous_id,
-                "status": "partial",
-                "note": note,
-            })
-
-        else:
-            note = f"Split products OK ({found} datasets)"
-            if verbose:
-                log.info(f"✅ [{mous_id}] {note}")
-
-            if not dry_run:
-                mark_split_complete(conn, mous_id, split_products)
-
-            results.append({
-                "mous_id": mous_id,
-                "status": "ok",
-                "note": note,
-            })
-
-    return results
+    # one query for the unique targets of every MOUS
+    targets_by_mous = get_all_unique_target_names(conn)
+
+    base = str(dataset_dir)
+
+    def _check_one(mous_id):
+        mous_dir = os.path.join(base, to_dir_mous_id(mous_id))
+        return _check_split_products_one(
+            conn,
+            mous_id,
+            fs_cache.scan(mous_dir),
+            targets_by_mous.get(mous_id, []),
+            verbose=verbose,
+            dry_run=dry_run,
+        )
+
+    # filesystem checks run in parallel; DB writes are applied afterwards
+    outcomes = map_mous(_check_one, mous_ids)
+    apply_writes(conn, [write for _, write in outcomes])
+
+    return [result for result, _ in outcomes]
+
+
+def _check_split_products_one(
+    conn,
+    mous_id: str,
+    scan: dict,
+    targets: list[str],
+    verbose: bool = False,
+    dry_run: bool = False,
+) -> tuple[dict, partial | None]:
+    """Split product check for a single MOUS, given its cached directory scan.
+
+    Returns the result dict and the deferred status write (None if no write).
+    """
+    if not scan["splits_exists"]:
+        return {
+            "mous_id": mous_id,
+            "status": "none",
+            "note": "No split directory",
+        }, None
+
+    split_products = scan["split_ms"]
+    found = len(split_products)
+
+    # join stems once so each target is a single substring search
+    stems_blob = "\n".join(
+        os.path.basename(p).rsplit(".", 1)[0] for p in split_products
+    )
+    missing_targets = [t for t in targets if t not in stems_blob]
+
+    if len(split_products) == 0:
+
+        write = None if dry_run else partial(mark_split_missing, conn, mous_id)
+
+        return {
+            "mous_id": mous_id,
+            "status": "none",
+            "note": "Split directory exists but contains no .ms files",
+        }, write
+
+    if missing_targets:
+        note = f"Missing split datasets for: {', '.join(missing_targets)}"
+        if verbose:
+            log.warning(f"⚠️ [{mous_id}] {note}")
+
+        write = None if dry_run else partial(
+            mark_split_partial, conn, mous_id, split_products, missing_targets
+        )
+
+        return {
+            "mous_id": mous_id,
+            "status": "partial",
+            "note": note,
+        }, write
+
+    else:
+        note = f"Split products OK ({found} datasets)"
+        if verbose:
+            log.info(f"✅ [{mous_id}] {note}")
+
+        write = None if dry_run else partial(
+            mark_split_complete, conn, mous_id, split_products
+        )
+
+        return {
+            "mous_id": mous_id,
+            "status": "ok",
+            "note": note,
+        }, write
@@ -4,6 +4,10 @@ CHECK = "🟢"
 CROSS = "🔴"
 
 
+# checkers emit canonical lowercase statuses; only these count as present
+_STATUS_OK = frozenset({"ok"})
+
+
 def _is_ok_status(record) -> bool:
     """
     Interpret a single check result dict as 'ok' or not.
@@ -14,18 +18,9 @@ def _is_ok_status(record) -> bool:
         return False
 
     val = record.get("status", "")
-    if isinstance(val, bool):
-        return val
-
-    s = str(val).strip().lower()
-    # adjust these rules if your checkers use different labels
-    if "ok" in s or "✅" in s:
-        return True
-    if "missing" in s or "no data" in s or "❌" in s:
-        return False
-    if "partial" in s or "⚠" in s:
-        return False  # treat partial as NOT "ok" for presence
-    return False
+    if isinstance(val, str):
+        return val in _STATUS_OK
+    return bool(val)
 
 
 def summarize_results(raw, splits, listobs, db_path, show_table=False):
@@ -47,32 +42,32 @@ def summarize_results(raw, splits, listobs, db_path, show_table=False):
     """
 
     # ------------------------------------------------------------
-    # 1. Build index: mous_id -> record for each check
-    # ------------------------------------------------------------
-    raw_by_mous = {r["mous_id"]: r for r in raw}
-    splits_by_mous = {r["mous_id"]: r for r in splits}
-    listobs_by_mous = {r["mous_id"]: r for r in listobs}
-
-    # union of all MOUS IDs we saw in any check
-    mous_ids = sorted(set(raw_by_mous) | set(splits_by_mous) | set(listobs_by_mous))
-
-    # ------------------------------------------------------------
-    # 2. File-level presence (no priority override!)
-    #    This is what we use for the global counts.
+    # 1+2. File-level presence per MOUS (no priority override!)
+    #      One fused pass over each check's results; the union of
+    #      MOUS IDs falls out as the keys. Used for the global counts.
     # ------------------------------------------------------------
     files_present = {}
-    for mid in mous_ids:
-        files_present[mid] = {
-            "raw": _is_ok_status(raw_by_mous.get(mid)),
-            "splits": _is_ok_status(splits_by_mous.get(mid)),
-            "listobs": _is_ok_status(listobs_by_mous.get(mid)),
-        }
+    for stage, records in (("raw", raw), ("splits", splits), ("listobs", listobs)):
+        for r in records:
+            st = files_present.get(r["mous_id"])
+            if st is None:
+                st = files_present[r["mous_id"]] = {
+                    "raw": False,
+                    "splits": False,
+                    "listobs": False,
+                }
+            st[stage] = _is_ok_status(r)
+
+    mous_ids = sorted(files_present)
 
     # global stats (what actually exists on disk)
     total_mous = len(mous_ids)
-    num_raw_ok = sum(1 for st in files_present.values() if st["raw"])
-    num_splits_ok = sum(1 for st in files_present.values() if st["splits"])
-    num_listobs_ok = sum(1 for st in files_present.values() if st["listobs"])
+    num_raw_ok = num_splits_ok = num_listobs_ok = 0
+    for st in files_present.values():
+        # bools add as 0/1, so one pass fills all three counters
+        num_raw_ok += st["raw"]
+        num_splits_ok += st["splits"]
+        num_listobs_ok += st["listobs"]
 
     # ------------------------------------------------------------
     # 3. Stage-level view for the table, with priority override:
@@ -114,8 +109,7 @@ def summarize_results(raw, splits, listobs, db_path, show_table=False):
                 CHECK if st["listobs"] else CROSS,
             ])
 
-        table = sorted(table, key=lambda row: row[0])
-        
+        # table is already ordered, since mous_ids is sorted
         print("\n=== PER-MOUS STATUS TABLE ===")
         print(
             tabulate(
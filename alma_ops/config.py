@@ -8,6 +8,7 @@ Central configuration for ALMA-SAILS project.
 # imports
 # ---------------------------------------------------------------------
 
+from functools import lru_cache
 from pathlib import Path
 
 # Root directory of the project (ALMA-SAILS/)
@@ -17,6 +18,11 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 # Central database location
 DB_PATH = PROJECT_ROOT / "db" / "serpens_main.db"
 
+# WAL journaling, mmap and synchronous=NORMAL for faster writes. Only for local
+# copies of the database: the shared DB_PATH lives on /arc, is reached over
+# sshfs, and is written by headless sessions on other hosts, so keep this off
+DB_LOCAL_TUNING = False
+
 # Related directories
 DATASETS_DIR = PROJECT_ROOT / "datasets"
 SRDP_WEBLOG_DIR = PROJECT_ROOT / "SRDP_weblogs"
@@ -30,6 +36,24 @@ SCRIPTS_DIR = PROJECT_ROOT / "scripts"
 # What the VM sees vs what the platform sees
 VM_MOUNT_PREFIX = "/home/ubuntu/canfar_arc/projects/ALMA-SAILS"
 PLATFORM_PREFIX = "/arc/projects/ALMA-SAILS"
+_VM_PREFIX_LEN = len(VM_MOUNT_PREFIX)
+_PLATFORM_PREFIX_LEN = len(PLATFORM_PREFIX)
+
+
+@lru_cache(maxsize=1024)
+def _swap_to_platform(path: str) -> str:
+    """Swap a leading VM mount prefix for the platform prefix (no full-string scan)."""
+    if path.startswith(VM_MOUNT_PREFIX):
+        return PLATFORM_PREFIX + path[_VM_PREFIX_LEN:]
+    return path
+
+
+@lru_cache(maxsize=1024)
+def _swap_to_vm(path: str) -> Path:
+    """Swap a leading platform prefix for the VM mount prefix (no full-string scan)."""
+    if path.startswith(PLATFORM_PREFIX):
+        return Path(VM_MOUNT_PREFIX + path[_PLATFORM_PREFIX_LEN:])
+    return Path(path)
 
 
 def to_platform_path(path: Path | str | list[Path | str]) -> str | list[str]:
@@ -50,10 +74,11 @@ def to_platform_path(path: Path | str | list[Path | str]) -> str | list[str]:
         Single: /mnt/pspace/datasets/uid_123 → /arc/projects/ALMA-SAILS/datasets/uid_123
         List: ["/mnt/pspace/a", "/mnt/pspace/b"] → ["/arc/projects/ALMA-SAILS/a", ...]
     """
+    # conversions are memoized on the str form, since flows convert the same
+    # few paths (db_path, mous dirs, script paths) over and over
     if isinstance(path, list):
-        return [str(p).replace(VM_MOUNT_PREFIX, PLATFORM_PREFIX) for p in path]
-    else:
-        return str(path).replace(VM_MOUNT_PREFIX, PLATFORM_PREFIX)
+        return [_swap_to_platform(str(p)) for p in path]
+    return _swap_to_platform(str(path))
 
 
 def to_vm_path(path: str | list[str]) -> Path | list[Path]:
@@ -75,9 +100,8 @@ def to_vm_path(path: str | list[str]) -> Path | list[Path]:
         List: ["/arc/.../a", "/arc/.../b"] → [Path("/mnt/pspace/a"), ...]
     """
     if isinstance(path, list):
-        return [Path(p.replace(PLATFORM_PREFIX, VM_MOUNT_PREFIX)) for p in path]
-    else:
-        return Path(path.replace(PLATFORM_PREFIX, VM_MOUNT_PREFIX))
+        return [_swap_to_vm(str(p)) for p in path]
+    return _swap_to_vm(str(path))
 
 
 # CASA Image to use for processing
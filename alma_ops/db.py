@@ -8,50 +8,289 @@ Database operations for ALMA MOUS and pipeline state management.
 # imports
 # ---------------------------------------------------------------------
 
+import atexit
+import itertools
 import json
-import re
+import queue
 import sqlite3
+import time
+from collections import defaultdict, namedtuple
 from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, NamedTuple
+
+from alma_ops.config import DB_LOCAL_TUNING
+
+try:
+    import orjson
+except ImportError:  # orjson ships with prefect; fall back to stdlib otherwise
+    orjson = None
+
+# JSON helpers: orjson when available, with json.dumps-compatible output types
+# (str, and non-str dict keys allowed). orjson.JSONDecodeError subclasses
+# json.JSONDecodeError, so existing except clauses keep working.
+if orjson is not None:
+
+    def _json_dumps(value) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# per-connection tuning applied by get_db_connection(); these only touch
+# process-local state, so they are safe on the shared database under /arc,
+# which other hosts write to over the network (WAL and mmap are not)
+_CONNECTION_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache
+    "PRAGMA busy_timeout=5000",
+)
+
+# extra tuning for local database copies only (config.DB_LOCAL_TUNING); WAL
+# is set once per db_path, since it persists in the database file
+_LOCAL_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+
+# one-time setup (journal mode, indexes) is done once per db_path per process
+_INITIALIZED_DB_PATHS: set[str] = set()
+
+# first characters of the JSON values stored in TEXT columns
+_JSON_START_CHARS = frozenset('[{"')
+
+# TEXT columns holding JSON lists/dicts, serialized by the update_* writers
+_JSON_COLUMNS: frozenset[str] = frozenset(
+    {
+        # mous
+        "asdm_paths",
+        # pipeline_state
+        "calibrated_products",
+        "split_products_path",
+        "selfcal_products_nonsub_path",
+        "selfcal_products_sub_path",
+        "final_imaging_products_path",
+        "raw_data_spectral_remap",
+    }
+)
+# values in JSON columns that are written through unchanged
+_RAW_TYPES = frozenset({str, type(None)})
+
+# covering indexes for the per-MOUS targets lookups; created on existing
+# databases by ensure_indexes() (new ones get them from database_schema.sql)
+_TARGET_INDEXES = {
+    "idx_targets_mous_sort": "targets(mous_id, alma_source_name, obs_id)",
+    "idx_targets_mous_asdm": "targets(mous_id, asdm_uid)",
+}
+
+# reusable connections per db_path, handed out by pooled_connection()
+_POOL_SIZE = 4
+_POOL: dict[str, queue.LifoQueue] = {}
+
+# unique names for the SAVEPOINTs opened by nested db_transaction() blocks
+_SAVEPOINT_IDS = itertools.count()
 
 # =====================================================================
 # Fetching and executing database operations
 # =====================================================================
 
 
-def get_db_connection(db_path: str) -> sqlite3.Connection:
+def get_db_connection(
+    db_path: str, check_same_thread: bool = True, local_tuning: bool | None = None
+) -> sqlite3.Connection:
     """Establishes a connection to a database.
 
+    The database keeps SQLite's default rollback journal, since it is shared
+    over a network filesystem; a database left in WAL mode is switched back on
+    first use. Each connection gets a larger page cache and a busy timeout for
+    concurrent writers. Connections run in autocommit mode; group writes with
+    db_transaction().
+
+    With local_tuning, the database is instead switched to WAL journaling and
+    each connection also gets synchronous=NORMAL and mmap. Only use this for a
+    database on local disk that no other host writes to.
+
     Parameters
     ----------
     db_path : str
         Path to the sqlite database.
+    check_same_thread : bool, optional
+        Whether only the creating thread may use the connection, by default True.
+    local_tuning : bool | None, optional
+        Whether to apply the local-disk tuning, by default None (which uses
+        DB_LOCAL_TUNING from config).
 
     Returns
     -------
     sqlite3.Connection
         An open connection to the on-disk database.
     """
-    conn = sqlite3.connect(db_path)
+    # autocommit mode: transactions are opened explicitly by db_transaction()
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=check_same_thread,
+        cached_statements=256,
+        isolation_level=None,
+    )
     conn.row_factory = sqlite3.Row
+
+    if local_tuning is None:
+        local_tuning = DB_LOCAL_TUNING
+
+    key = str(db_path)
+    if key not in _INITIALIZED_DB_PATHS:
+        if local_tuning:
+            conn.execute("PRAGMA journal_mode=WAL")
+        else:
+            _restore_rollback_journal(conn)
+        ensure_indexes(conn)
+        _INITIALIZED_DB_PATHS.add(key)
+
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    if local_tuning:
+        for pragma in _LOCAL_CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
     return conn
 
 
+def _restore_rollback_journal(conn: sqlite3.Connection):
+    """Switches a database left in WAL mode back to the rollback journal.
+
+    journal_mode=WAL persists in the database file, so a database once opened
+    in WAL mode stays that way for every writer (including the sqlite3 CLI in
+    headless sessions). Leaving WAL needs exclusive access; if another
+    connection holds the database, it is retried on the next process start.
+    """
+    (mode,) = conn.execute("PRAGMA journal_mode").fetchone()
+    if mode.lower() != "wal":
+        return
+    try:
+        conn.execute("PRAGMA journal_mode=DELETE")
+    except sqlite3.OperationalError:
+        pass
+
+
+def ensure_indexes(conn: sqlite3.Connection):
+    """Creates any missing covering indexes on the targets table.
+
+    Runs ANALYZE afterwards so the query planner picks the new indexes up.
+    A no-op for databases that already have them (or have no targets table).
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    """
+    existing = {
+        name
+        for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+        )
+    }
+    if "targets" not in existing:
+        return
+
+    missing = [name for name in _TARGET_INDEXES if name not in existing]
+    if not missing:
+        return
+
+    with db_transaction(conn):
+        for name in missing:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {_TARGET_INDEXES[name]}"
+            )
+    conn.execute("ANALYZE")
+
+
+@contextmanager
+def pooled_connection(db_path: str):
+    """Checks out a reusable connection to a database, returning it on exit.
+
+    Behaves like ``with get_db_connection(db_path) as conn:`` (commit on
+    success, rollback on error), but keeps the connection and its warmed page
+    cache around for the next caller instead of discarding it.
+
+    Parameters
+    ----------
+    db_path : str
+        Path to the sqlite database.
+    """
+    key = str(db_path)
+    pool = _POOL.get(key)
+    if pool is None:
+        pool = _POOL.setdefault(key, queue.LifoQueue(maxsize=_POOL_SIZE))
+
+    try:
+        conn = pool.get_nowait()
+    except queue.Empty:
+        conn = get_db_connection(db_path, check_same_thread=False)
+
+    try:
+        with conn:
+            yield conn
+    finally:
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+@atexit.register
+def close_pooled_connections():
+    """Closes every idle pooled connection (run automatically at interpreter exit)."""
+    for pool in list(_POOL.values()):
+        while True:
+            try:
+                pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
 @contextmanager
 def db_transaction(conn: sqlite3.Connection):
-    """Commits any pending transactions to the database.
+    """Runs the enclosed statements in one transaction, committing on success.
+
+    The transaction is opened with BEGIN IMMEDIATE, so the write lock is taken
+    up front rather than retried mid-transaction when writers race. Nested use
+    runs inside a SAVEPOINT of the already-open transaction: a failing inner
+    block only rolls back its own statements, and the outermost block commits,
+    so a batch of writes still costs a single fsync.
 
     Parameters
     ----------
     conn : sqlite3.Connection
         An open connection to the on-disk database.
     """
+    if conn.in_transaction:
+        savepoint = f"sp_{next(_SAVEPOINT_IDS)}"
+        conn.execute(f"SAVEPOINT {savepoint}")
+        try:
+            yield
+        except Exception:
+            if conn.in_transaction:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+
+        if conn.in_transaction:
+            conn.execute(f"RELEASE {savepoint}")
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
     try:
         yield
-        conn.commit()
     except Exception:
-        conn.rollback()
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
         raise
 
+    if conn.in_transaction:
+        conn.execute("COMMIT")
+
 
 def db_fetch_one(
     conn: sqlite3.Connection, query: str, params: tuple = ()
@@ -99,6 +338,29 @@ def db_fetch_all(
     return cur.fetchall()
 
 
+def db_iter(conn: sqlite3.Connection, query: str, params: tuple = ()):
+    """Iterates over rows lazily, given the query and parameters.
+
+    Use instead of db_fetch_all() when the rows are only consumed once to
+    build a derived structure, so the full row list is never materialized.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    query : str
+        The SQL query to execute.
+    params : tuple, optional
+        Parameters to substitute into the SQL query, by default ().
+
+    Returns
+    -------
+    Iterator[sqlite3.Row]
+        An iterator over the sqlite3.Row objects from the query result.
+    """
+    return iter(conn.execute(query, params))
+
+
 def db_execute(
     conn: sqlite3.Connection, query: str, params: tuple = (), commit: bool = False
 ):
@@ -123,12 +385,19 @@ def db_execute(
 def parse_json_safe(value):
     """Parses a JSON string safely, returning None if the input is None,
     or returning the original value if it is not valid JSON.
+
+    Only strings that start like a JSON array, object, or string are handed to
+    the parser; anything else (e.g. a plain path) is returned as-is up front.
     """
     if value is None:
         return None
 
+    # plain values skip the parser and its exception path entirely
+    if isinstance(value, str) and value[:1] not in _JSON_START_CHARS:
+        return value
+
     try:
-        return json.loads(value)
+        return _json_loads(value)
     except (json.JSONDecodeError, TypeError):
         return value
 
@@ -138,7 +407,36 @@ def parse_json_safe(value):
 # =====================================================================
 
 
-def get_mous_record(conn: sqlite3.Connection, mous_id: str) -> sqlite3.Row | None:
+@lru_cache(maxsize=128)
+def _build_select_sql(table: str, cols: tuple[str, ...] | None = None) -> str:
+    """Builds (once per table and column set) the SELECT for a single record."""
+    if cols is None:
+        return f"SELECT * FROM {table} WHERE mous_id=?"
+
+    # column names are interpolated into the SQL, so only allow bare identifiers
+    for col in cols:
+        if not col.isidentifier():
+            raise ValueError(f"Invalid column name: {col!r}")
+    return f"SELECT {', '.join(cols)} FROM {table} WHERE mous_id=?"
+
+
+@lru_cache(maxsize=128)
+def _build_select_in_sql(table: str, cols: tuple[str, ...] | None, n: int) -> str:
+    """Builds (once per table, column set and ID count) the SELECT for n records."""
+    if cols is None:
+        select = "*"
+    else:
+        # column names are interpolated into the SQL, so only allow bare identifiers
+        for col in cols:
+            if not col.isidentifier():
+                raise ValueError(f"Invalid column name: {col!r}")
+        select = ", ".join(cols)
+    return f"SELECT {select} FROM {table} WHERE mous_id IN ({', '.join('?' * n)})"
+
+
+def get_mous_record(
+    conn: sqlite3.Connection, mous_id: str, cols: tuple[str, ...] | None = None
+) -> sqlite3.Row | None:
     """Fetches the row from the mous table for a given mous_id.
 
     Parameters
@@ -147,22 +445,20 @@ def get_mous_record(conn: sqlite3.Connection, mous_id: str) -> sqlite3.Row | Non
         An open connection to the on-disk database.
     mous_id : str
         The MOUS ID to query.
+    cols : tuple[str, ...] | None, optional
+        Columns to fetch, by default None (all columns).
 
     Returns
     -------
     sqlite3.Row | None
         A single row from the mous table, or None if no rows match.
     """
-    row = db_fetch_one(
-        conn,
-        "SELECT * FROM mous WHERE mous_id=?",
-        (mous_id,),
-    )
+    row = db_fetch_one(conn, _build_select_sql("mous", cols), (mous_id,))
     return row if row else None
 
 
 def get_pipeline_state_record(
-    conn: sqlite3.Connection, mous_id: str
+    conn: sqlite3.Connection, mous_id: str, cols: tuple[str, ...] | None = None
 ) -> sqlite3.Row | None:
     """Fetches the row from the pipeline_state table for a given mous_id.
 
@@ -172,23 +468,33 @@ def get_pipeline_state_record(
         An open connection to the on-disk database.
     mous_id : str
         The MOUS ID to query.
+    cols : tuple[str, ...] | None, optional
+        Columns to fetch, by default None (all columns). Pass only the
+        columns the caller reads to avoid materializing the whole row.
 
     Returns
     -------
     sqlite3.Row | None
         A single row from the pipeline_state table, or None if no rows match.
     """
-    row = db_fetch_one(
-        conn,
-        "SELECT * FROM pipeline_state WHERE mous_id=?",
-        (mous_id,),
-    )
+    row = db_fetch_one(conn, _build_select_sql("pipeline_state", cols), (mous_id,))
     return row if row else None
 
 
-def update_pipeline_state_record(conn: sqlite3.Connection, mous_id: str, **fields):
-    """Updates one or more fields in the pipeline_state table.
-    Automatically JSON-serializes lists and dictionaries for TEXT-based fields.
+@lru_cache(maxsize=32)
+def _pipeline_state_type(cols: tuple[str, ...]) -> type:
+    """Builds (once per column set) the PipelineState namedtuple type."""
+    return namedtuple("PipelineState", cols)
+
+
+def get_pipeline_state(
+    conn: sqlite3.Connection, mous_id: str, cols: tuple[str, ...]
+) -> tuple | None:
+    """Fetches the given pipeline_state columns for a mous_id as a namedtuple.
+
+    Unlike get_pipeline_state_record, the row is fetched as a plain tuple and
+    its fields are read as attributes (``state.selfcal_status``), skipping the
+    per-column name lookup of sqlite3.Row.
 
     Parameters
     ----------
@@ -196,28 +502,203 @@ def update_pipeline_state_record(conn: sqlite3.Connection, mous_id: str, **field
         An open connection to the on-disk database.
     mous_id : str
         The MOUS ID to query.
-    **fields
-        Key-value pairs of fields to update.
+    cols : tuple[str, ...]
+        Columns to fetch, in the order of the returned fields.
+
+    Returns
+    -------
+    tuple | None
+        A PipelineState namedtuple with one field per column, or None if no
+        rows match.
+    """
+    cur = conn.cursor()
+    cur.row_factory = None
+    row = cur.execute(_build_select_sql("pipeline_state", cols), (mous_id,)).fetchone()
+    return _pipeline_state_type(cols)._make(row) if row else None
+
+
+# stay under SQLite's bound-parameter limit (999 on older builds)
+_MAX_IN_PARAMS = 900
+
+
+def get_pipeline_state_records(
+    conn: sqlite3.Connection,
+    mous_ids: Iterable[str],
+    cols: tuple[str, ...] | None = None,
+) -> dict[str, sqlite3.Row]:
+    """Fetches the pipeline_state rows of many mous_ids in one query.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    mous_ids : Iterable[str]
+        The MOUS IDs to query.
+    cols : tuple[str, ...] | None, optional
+        Columns to fetch, by default None (all columns). mous_id is always
+        included.
+
+    Returns
+    -------
+    dict[str, sqlite3.Row]
+        Rows keyed by mous_id; IDs without a row are left out.
+    """
+    if cols is not None and "mous_id" not in cols:
+        cols = ("mous_id",) + tuple(cols)
+
+    ids = list(dict.fromkeys(mous_ids))
+    records = {}
+    for start in range(0, len(ids), _MAX_IN_PARAMS):
+        chunk = ids[start : start + _MAX_IN_PARAMS]
+        query = _build_select_in_sql("pipeline_state", cols, len(chunk))
+        for row in db_iter(conn, query, tuple(chunk)):
+            records[row["mous_id"]] = row
+    return records
+
+
+@lru_cache(maxsize=128)
+def _build_update_sql(table: str, keys: tuple[str, ...]) -> str:
+    """Builds (once per table and field set) the UPDATE statement for a record."""
+    # reject malformed column lists up front rather than as a sqlite syntax error
+    # (and the resulting rollback) at execute time
+    if not keys:
+        raise ValueError("No fields given to update")
+    for k in keys:
+        if not k.isidentifier():
+            raise ValueError(f"Invalid column name: {k!r}")
+
+    cols = ", ".join(f"{k}=?" for k in keys)
+    return f"UPDATE {table} SET {cols} WHERE mous_id=?"
+
+
+def _serialize_fields(fields: dict) -> dict:
+    """JSON-serializes the values of JSON-backed TEXT columns.
+
+    Values already given as str (pre-serialized) or None are stored as-is.
+    Lists and dictionaries passed for any other column are still serialized,
+    since sqlite3 cannot bind them.
     """
+    serialized = {}
+    for k, v in fields.items():
+        if k in _JSON_COLUMNS:
+            if v.__class__ not in _RAW_TYPES:
+                v = _json_dumps(v)
+        elif isinstance(v, (list, dict)):
+            v = _json_dumps(v)
+        serialized[k] = v
+    return serialized
+
+
+def _update_statement(table: str, mous_id: str, fields: dict) -> tuple[str, tuple]:
+    """Returns the UPDATE statement and its positional parameters for one record.
+
+    Columns are ordered by name, so the same field set always maps to the same
+    SQL text (one cached statement, one executemany batch) whatever order the
+    caller passed the fields in.
+    """
+    items = sorted(_serialize_fields(fields).items())
+    sql = _build_update_sql(table, tuple(k for k, _ in items))
+    return sql, (*(v for _, v in items), mous_id)
+
+
+def _update_record(conn: sqlite3.Connection, table: str, mous_id: str, fields: dict):
+    """Updates one or more fields of a single record in the given table."""
     if not fields:
         return
 
-    # serialize lists and dicts to JSON strings
-    serialized_fields = {
-        k: json.dumps(v) if isinstance(v, (list, dict)) else v
-        for k, v in fields.items()
-    }
+    sql, values = _update_statement(table, mous_id, fields)
+
+    with db_transaction(conn):
+        conn.execute(sql, values)
+
+    if "raw_data_spectral_remap" in fields:
+        _SPW_REMAP_CACHE.invalidate()
+
+
+def update_records_bulk(
+    conn: sqlite3.Connection, table: str, rows: list[tuple[str, dict]]
+):
+    """Updates many records of a table in a single transaction.
+
+    Rows sharing the same set of fields (in any order) are sent through one
+    executemany call.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    table : str
+        The table to update ("mous" or "pipeline_state").
+    rows : list[tuple[str, dict]]
+        (mous_id, fields) pairs, where fields maps column names to new values.
+    """
+    params_by_sql = defaultdict(list)
+    touches_spw_remap = False
+    for mous_id, fields in rows:
+        if not fields:
+            continue
+        touches_spw_remap = touches_spw_remap or "raw_data_spectral_remap" in fields
+        sql, values = _update_statement(table, mous_id, fields)
+        params_by_sql[sql].append(values)
+
+    if not params_by_sql:
+        return
 
-    cols = ", ".join(f"{k}=?" for k in serialized_fields)
-    values = list(serialized_fields.values()) + [mous_id]
+    with db_transaction(conn):
+        for sql, params in params_by_sql.items():
+            conn.executemany(sql, params)
+
+    if touches_spw_remap:
+        _SPW_REMAP_CACHE.invalidate()
+
+
+def set_pipeline_field_bulk(
+    conn: sqlite3.Connection, field: str, value, mous_ids: Iterable[str]
+):
+    """Sets one pipeline_state field to the same value for many MOUS IDs.
+
+    The statement is parsed once and all rows are written in one transaction.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    field : str
+        The column to update.
+    value
+        The value to set (JSON-serialized for JSON-backed columns).
+    mous_ids : Iterable[str]
+        The MOUS IDs to update.
+    """
+    sql = _build_update_sql("pipeline_state", (field,))
+    value = _serialize_fields({field: value})[field]
 
     with db_transaction(conn):
-        conn.execute(f"UPDATE pipeline_state SET {cols} WHERE mous_id=?", values)
+        conn.executemany(sql, ((value, mous_id) for mous_id in mous_ids))
+
+    if field == "raw_data_spectral_remap":
+        _SPW_REMAP_CACHE.invalidate()
+
+
+def update_pipeline_state_record(conn: sqlite3.Connection, mous_id: str, **fields):
+    """Updates one or more fields in the pipeline_state table.
+    Automatically JSON-serializes values for JSON-backed TEXT columns.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    mous_id : str
+        The MOUS ID to query.
+    **fields
+        Key-value pairs of fields to update.
+    """
+    _update_record(conn, "pipeline_state", mous_id, fields)
 
 
 def update_mous_record(conn: sqlite3.Connection, mous_id: str, **fields):
     """Updates one or more fields in the mous table.
-    Automatically JSON-serializes lists and dictionaries for TEXT-based fields.
+    Automatically JSON-serializes values for JSON-backed TEXT columns.
 
     Parameters
     ----------
@@ -228,20 +709,131 @@ def update_mous_record(conn: sqlite3.Connection, mous_id: str, **fields):
     **fields
         Key-value pairs of fields to update.
     """
-    if not fields:
-        return
+    _update_record(conn, "mous", mous_id, fields)
 
-    # serialize lists and dicts to JSON strings
-    serialized_fields = {
-        k: json.dumps(v) if isinstance(v, (list, dict)) else v
-        for k, v in fields.items()
-    }
 
-    cols = ", ".join(f"{k}=?" for k in serialized_fields)
-    values = list(serialized_fields.values()) + [mous_id]
+def claim_mous_for_selfcal(
+    conn: sqlite3.Connection, mous_id: str, expected_status: str = "prepped"
+) -> dict:
+    """Validates and claims a MOUS for self-calibration in one transaction.
 
+    Reads the MOUS pipeline_state fields the selfcal flows need, checks that
+    selfcal_status is expected_status, then moves it to 'in_progress' and stamps
+    selfcal_started_at. The UPDATE is conditional on the status still being
+    expected_status, so two concurrent flow runs cannot both claim the MOUS.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    mous_id : str
+        The MOUS ID to claim.
+    expected_status : str, optional
+        The selfcal_status the MOUS must be in, by default "prepped".
+
+    Returns
+    -------
+    dict
+        The pre_selfcal_listobs_status, selfcal_status and mous_directory values
+        read before the claim.
+
+    Raises
+    ------
+    ValueError
+        If the MOUS ID is not found in the database.
+    ValueError
+        If the selfcal_status is not expected_status.
+    RuntimeError
+        If the MOUS was claimed by another run in the meantime.
+    """
     with db_transaction(conn):
-        conn.execute(f"UPDATE mous SET {cols} WHERE mous_id=?", values)
+        row = get_pipeline_state_record(
+            conn,
+            mous_id,
+            cols=("pre_selfcal_listobs_status", "selfcal_status", "mous_directory"),
+        )
+        if not row:
+            raise ValueError(f"MOUS ID {mous_id} not found")
+
+        selfcal_status = row["selfcal_status"]
+        if selfcal_status != expected_status:
+            raise ValueError(
+                f"MOUS {mous_id} has selfcal_status '{selfcal_status}', "
+                f"expected '{expected_status}'"
+            )
+
+        cur = conn.execute(
+            "UPDATE pipeline_state "
+            "SET selfcal_status='in_progress', selfcal_started_at=CURRENT_TIMESTAMP "
+            "WHERE mous_id=? AND selfcal_status=?",
+            (mous_id, expected_status),
+        )
+        if cur.rowcount == 0:
+            raise RuntimeError(f"MOUS {mous_id} was claimed by another run")
+
+    return dict(row)
+
+
+def update_pipeline_status_if(
+    conn: sqlite3.Connection,
+    mous_id: str,
+    column: str,
+    status: str,
+    expected_status: str,
+) -> bool:
+    """Sets a pipeline_state status column, only if it still holds expected_status.
+
+    Used where a status may have been moved on by another writer (e.g. a
+    headless session script), which must not be overwritten.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    mous_id : str
+        The MOUS ID to update.
+    column : str
+        The status column to update.
+    status : str
+        The new status.
+    expected_status : str
+        The status the column must currently hold.
+
+    Returns
+    -------
+    bool
+        Whether the status was updated.
+    """
+    sql = f"{_build_update_sql('pipeline_state', (column,))} AND {column}=?"
+    cur = conn.execute(sql, (status, mous_id, expected_status))
+    return cur.rowcount > 0
+
+
+def get_pipeline_state_column(conn: sqlite3.Connection, mous_id: str, column: str):
+    """Fetches the raw value of a single pipeline_state column for a given mous_id.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    mous_id : str
+        The MOUS ID to query.
+    column : str
+        The column name to fetch.
+
+    Returns
+    -------
+    The raw column value, or None if no rows match.
+
+    Raises
+    ------
+    ValueError
+        If the column name is not a valid identifier.
+    """
+    row = db_fetch_one(
+        conn, _build_select_sql("pipeline_state", (column,)), (mous_id,)
+    )
+    return row[0] if row else None
 
 
 def get_pipeline_state_record_column_value(
@@ -269,14 +861,8 @@ def get_pipeline_state_record_column_value(
     ValueError
         If the specified column contains invalid JSON.
     """
-    row = get_pipeline_state_record(conn, mous_id)
-
-    if not row:
-        return None
-
-    raw = row[column]
-
-    return parse_json_safe(raw)
+    # single-column read; parse_json_safe passes a missing row's None through
+    return parse_json_safe(get_pipeline_state_column(conn, mous_id, column))
 
 
 # =====================================================================
@@ -317,12 +903,50 @@ def get_unique_target_names(conn: sqlite3.Connection, mous_id: str) -> list[str]
     list[str]
         A list of unique target names for the given mous_id.
     """
-    rows = db_fetch_all(
+    rows = db_iter(
         conn,
         "SELECT DISTINCT alma_source_name FROM targets WHERE mous_id=?",
         (mous_id,),
     )
-    return [r["alma_source_name"] for r in rows]
+    return [r[0] for r in rows]
+
+
+def get_all_unique_target_names(conn: sqlite3.Connection) -> dict[str, list[str]]:
+    """Fetches the unique target names for every mous_id in a single query.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        A mapping of mous_id to its list of unique target names.
+    """
+    rows = db_iter(conn, "SELECT DISTINCT mous_id, alma_source_name FROM targets")
+
+    targets_by_mous = defaultdict(list)
+    for mous_id, alma_source_name in rows:
+        targets_by_mous[mous_id].append(alma_source_name)
+    return dict(targets_by_mous)
+
+
+def get_all_expected_asdms(conn: sqlite3.Connection) -> dict[str, int]:
+    """Fetches the expected number of ASDMs for every mous_id in a single query.
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+
+    Returns
+    -------
+    dict[str, int]
+        A mapping of mous_id to its expected ASDM count (0 if unset).
+    """
+    rows = db_iter(conn, "SELECT mous_id, num_asdms FROM mous")
+    return {mous_id: int(num_asdms or 0) for mous_id, num_asdms in rows}
 
 
 def get_mous_asdms_from_targets(conn: sqlite3.Connection, mous_id: str) -> list[str]:
@@ -340,10 +964,13 @@ def get_mous_asdms_from_targets(conn: sqlite3.Connection, mous_id: str) -> list[
     list[str]
         A list of unique ASDM UIDs for the given mous_id.
     """
-    rows = db_fetch_all(
-        conn, "SELECT DISTINCT asdm_uid FROM targets WHERE mous_id=?", (mous_id,)
+    rows = db_iter(
+        conn,
+        "SELECT DISTINCT asdm_uid FROM targets "
+        "WHERE mous_id=? AND asdm_uid IS NOT NULL AND asdm_uid != ''",
+        (mous_id,),
     )
-    return [r["asdm_uid"] for r in rows if r["asdm_uid"]]
+    return [r[0] for r in rows]
 
 
 def get_mous_spw_mapping(conn: sqlite3.Connection, mous_id: str) -> list[int]:
@@ -363,30 +990,134 @@ def get_mous_spw_mapping(conn: sqlite3.Connection, mous_id: str) -> list[int]:
     list[int]
         A sorted list of unique SPW integers for the given mous_id.
     """
-    rows = db_fetch_all(conn, "SELECT obs_id FROM targets WHERE mous_id=?", (mous_id,))
+    # checks if any user-defined spw remapping is set for the MOUS
+    spw_remap = get_spw_remap(conn, mous_id) or {}
+
+    # sqlite extracts the trailing ".spw.<digits>" number and de-duplicates it,
+    # so only one row per unique SPW crosses into python; a plain-tuple cursor
+    # skips building a sqlite3.Row wrapper for each of them
+    cur = conn.cursor()
+    cur.row_factory = None
+    rows = cur.execute(
+        """
+        SELECT DISTINCT CAST(spw AS INTEGER) FROM (
+            SELECT substr(obs_id, instr(obs_id, '.spw.') + 5) AS spw
+            FROM targets
+            WHERE mous_id=? AND instr(obs_id, '.spw.') > 0
+        )
+        WHERE spw != '' AND spw NOT GLOB '*[^0-9]*'
+        """,
+        (mous_id,),
+    )
 
-    # pattern to extract SPW number
-    spw_pattern = re.compile(r"\.spw\.(\d+)$")
-    spws = set()
+    # remap if needed (remap may merge SPWs, so de-duplicate again)
+    remap_get = spw_remap.get
+    return sorted({remap_get(spw, spw) for (spw,) in rows})
 
-    # checks if any user-defined spw remapping is set for the MOUS
-    spw_remap = get_spw_remap(conn, mous_id)
 
-    for (obs_id,) in rows:
-        m = spw_pattern.search(obs_id or "")
+class MousTargets(NamedTuple):
+    """Everything derived from a MOUS's targets rows, built in one query."""
+
+    unique_names: list[str]
+    asdm_uids: list[str]
+    spws: list[int]
+    spws_by_target: dict[str, list[int]]
 
-        if not m:
-            continue
 
-        spw = int(m.group(1))
+def load_mous_target_bundle(conn: sqlite3.Connection, mous_id: str) -> MousTargets:
+    """Fetches the unique target names, ASDM UIDs and SPWs of a MOUS in one pass.
 
-        # remap if needed
-        if spw_remap and str(spw) in spw_remap:
-            spw = spw_remap[str(spw)]
+    Equivalent to calling get_unique_target_names, get_mous_asdms_from_targets
+    and get_mous_spw_mapping in turn, but with a single query over targets.
+    Any user-defined SPW remapping is applied.
 
-        spws.add(spw)
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        An open connection to the on-disk database.
+    mous_id : str
+        The MOUS ID to query.
+
+    Returns
+    -------
+    MousTargets
+        Unique target names and ASDM UIDs (in table order), the sorted unique
+        SPWs, and the sorted unique SPWs per target name.
+    """
+    spw_remap = get_spw_remap(conn, mous_id) or {}
+    remap_get = spw_remap.get
+
+    # same ".spw.<digits>" extraction as get_mous_spw_mapping (NULL if absent)
+    cur = conn.cursor()
+    cur.row_factory = None
+    rows = cur.execute(
+        """
+        SELECT alma_source_name, asdm_uid,
+            CASE WHEN spw != '' AND spw NOT GLOB '*[^0-9]*'
+                THEN CAST(spw AS INTEGER) END
+        FROM (
+            SELECT alma_source_name, asdm_uid,
+                CASE WHEN instr(obs_id, '.spw.') > 0
+                    THEN substr(obs_id, instr(obs_id, '.spw.') + 5) END AS spw
+            FROM targets
+            WHERE mous_id=?
+        )
+        """,
+        (mous_id,),
+    )
+
+    names, asdm_uids = {}, {}
+    spws_by_target = defaultdict(set)
+    for name, asdm_uid, spw in rows:
+        names[name] = None
+        if asdm_uid:
+            asdm_uids[asdm_uid] = None
+        if spw is not None:
+            spws_by_target[name].add(remap_get(spw, spw))
+
+    return MousTargets(
+        unique_names=list(names),
+        asdm_uids=list(asdm_uids),
+        spws=sorted(set().union(*spws_by_target.values())),
+        spws_by_target={k: sorted(v) for k, v in spws_by_target.items()},
+    )
+
+
+class _SpwRemapCache:
+    """TTL cache of parsed raw_data_spectral_remap values, keyed by mous_id.
+
+    Writes of raw_data_spectral_remap through this module bump the generation
+    counter, which drops every cached entry; the TTL bounds how long a change
+    made by another process (e.g. scripts/add_spw_remap.py) can go unseen.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: dict[str, tuple[int, float, dict | None]] = {}
+
+    def get(self, mous_id: str) -> tuple[bool, dict | None]:
+        entry = self._entries.get(mous_id)
+        if entry is None:
+            return False, None
+
+        generation, expires_at, remap = entry
+        if generation != self.generation or time.monotonic() >= expires_at:
+            return False, None
+        return True, remap
+
+    def put(self, mous_id: str, remap: dict | None, generation: int):
+        # an entry read before an invalidation is already stale; don't keep it
+        if generation != self.generation:
+            return
+        self._entries[mous_id] = (generation, time.monotonic() + self.ttl, remap)
 
-    return sorted(spws)
+    def invalidate(self):
+        self.generation += 1
+        self._entries.clear()
+
+
+_SPW_REMAP_CACHE = _SpwRemapCache()
 
 
 def get_spw_remap(conn: sqlite3.Connection, mous_id: str) -> dict | None:
@@ -410,22 +1141,20 @@ def get_spw_remap(conn: sqlite3.Connection, mous_id: str) -> dict | None:
     ValueError
         If the raw_data_spectral_remap entry contains invalid JSON.
     """
-    row = db_fetch_one(
-        conn,
-        "SELECT raw_data_spectral_remap FROM pipeline_state WHERE mous_id=?",
-        (mous_id,),
-    )
-
-    if not row:
-        return None
+    hit, remap = _SPW_REMAP_CACHE.get(mous_id)
+    if hit:
+        return remap
+    generation = _SPW_REMAP_CACHE.generation
 
-    value = row["raw_data_spectral_remap"]
+    value = get_pipeline_state_column(conn, mous_id, "raw_data_spectral_remap")
     if value is None:
-        return None
-
-    try:
-        raw = json.loads(value)
-    except json.JSONDecodeError as e:
-        raise ValueError("Invalid JSON in raw_data_spectral_remap") from e
-
-    return {int(k): int(v) for k, v in raw.items()}
+        remap = None
+    else:
+        try:
+            raw = _json_loads(value)
+        except json.JSONDecodeError as e:
+            raise ValueError("Invalid JSON in raw_data_spectral_remap") from e
+        remap = {int(k): int(v) for k, v in raw.items()}
+
+    _SPW_REMAP_CACHE.put(mous_id, remap, generation)
+    return remap
@@ -5,7 +5,8 @@ Custom logging setup for alma_ops with Prefect-style formatting.
 
 This module defines a logger that mimics the logging style used in Prefect, providing
 colored log levels and timestamps for better readability in the console. These are to
-be used by functions which are not prefect tasks or flows.
+be used by functions which are not prefect tasks or flows. Colors are only emitted when
+stderr is a terminal and NO_COLOR is unset.
 """
 
 # ---------------------------------------------------------------------
@@ -13,12 +14,26 @@ be used by functions which are not prefect tasks or flows.
 # ---------------------------------------------------------------------
 
 import logging
-from datetime import datetime
+import os
+import sys
 
-from colorama import Fore, Style
-from colorama import init as colorama_init
 
-colorama_init(autoreset=True)
+class _NoColor:
+    """Stands in for colorama's Fore/Style when output is not a terminal."""
+
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+
+# colors (and colorama's stream wrapping) only when stderr is a terminal;
+# file, journal, and Prefect worker logs get plain text written directly
+if sys.stderr.isatty() and os.environ.get("NO_COLOR") is None:
+    from colorama import Fore, Style
+    from colorama import init as colorama_init
+
+    colorama_init(autoreset=True)
+else:
+    Fore = Style = _NoColor()
 
 
 class PrefectStyleFormatter(logging.Formatter):
@@ -30,11 +45,26 @@ class PrefectStyleFormatter(logging.Formatter):
         "CRITICAL": Fore.RED + Style.BRIGHT,
     }
 
+    # per-level "%"-templates: HH:MM:SS.mmm | <colored level> | message
+    _FMT_CACHE = {
+        level: f"%02d:%02d:%02d.%03d | {color}{level:<8}{Style.RESET_ALL} | %s"
+        for level, color in COLORS.items()
+    }
+
     def format(self, record):
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        level_color = self.COLORS.get(record.levelname, "")
-        level_str = f"{level_color}{record.levelname:<8}{Style.RESET_ALL}"
-        return f"{timestamp} | {level_str} | {record.getMessage()}"
+        fmt = self._FMT_CACHE.get(record.levelname)
+        if fmt is None:
+            fmt = f"%02d:%02d:%02d.%03d | {record.levelname:<8}{Style.RESET_ALL} | %s"
+
+        # record.created is stamped by logging itself, so no extra clock read
+        ct = self.converter(record.created)
+        return fmt % (
+            ct.tm_hour,
+            ct.tm_min,
+            ct.tm_sec,
+            int(record.msecs),
+            record.getMessage(),
+        )
 
 
 def get_logger(name: str = "alma_ops", level: int = logging.INFO) -> logging.Logger:
@@ -44,5 +74,7 @@ def get_logger(name: str = "alma_ops", level: int = logging.INFO) -> logging.Log
         handler.setFormatter(PrefectStyleFormatter())
         logger.addHandler(handler)
         logger.propagate = False
-    logger.setLevel(level)
+    # setLevel flushes every logger's level cache, so skip it on repeat calls
+    if logger.level != level:
+        logger.setLevel(level)
     return logger
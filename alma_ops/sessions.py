@@ -0,0 +1,71 @@
+"""
+sessions.py
+--------------------
+Shared CANFAR headless-session client for the Prefect flows.
+
+Constructing a `canfar.sessions.Session` sets up its HTTP client and credentials,
+so flows reuse one per worker thread instead of building a new one in every task.
+"""
+
+# ---------------------------------------------------------------------
+# imports
+# ---------------------------------------------------------------------
+
+import threading
+
+from canfar.sessions import Session
+
+# one Session per thread, since Session is not documented as thread-safe and
+# Prefect runs sync tasks (and asyncio.to_thread calls) on worker threads
+_local = threading.local()
+
+
+def get_session() -> Session:
+    """Returns this thread's CANFAR Session, creating it on first use.
+
+    Returns
+    -------
+    Session
+        The reusable CANFAR session client.
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = Session()
+    return session
+
+
+def create_session_job(**kwargs) -> list[str]:
+    """Submits a headless session job with this thread's Session.
+
+    Meant for ``asyncio.to_thread(create_session_job, ...)``, so the Session used
+    belongs to the worker thread that makes the call.
+
+    Parameters
+    ----------
+    **kwargs
+        Keyword arguments forwarded to `Session.create`.
+
+    Returns
+    -------
+    list[str]
+        The ID(s) of the launched job(s).
+    """
+    return get_session().create(**kwargs)
+
+
+def get_session_info(**kwargs) -> list[dict]:
+    """Fetches headless session info with this thread's Session.
+
+    Meant for ``asyncio.to_thread(get_session_info, ...)``, like create_session_job.
+
+    Parameters
+    ----------
+    **kwargs
+        Keyword arguments forwarded to `Session.info`.
+
+    Returns
+    -------
+    list[dict]
+        The info record(s) of the requested session(s).
+    """
+    return get_session().info(**kwargs)
@@ -4,6 +4,33 @@ utils.py
 Utility functions for ALMA dataset operations.
 """
 
+# ---------------------------------------------------------------------
+# imports
+# ---------------------------------------------------------------------
+
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+
+# both MOUS ID forms in one pattern: uid___A001_X123_Xabc or uid://A001/X123/Xabc
+# (the lookaheads keep each form's separator from leaking into the other)
+_MOUS_ID_RE = re.compile(
+    r"uid(?:___(?=[^/]*$)|://(?=[^_]*$))"
+    r"([A-Za-z0-9]+)[_/]([A-Za-z0-9]+)[_/]([A-Za-z0-9]+)"
+)
+
+
+def _match_mous_id(mous_id: str) -> tuple[str, str, str]:
+    """Splits a stripped MOUS ID (either form) into its three UID parts."""
+    m = _MOUS_ID_RE.fullmatch(mous_id)
+    if m is not None:
+        return m.groups()
+
+    if mous_id.startswith(("uid___", "uid://")):
+        raise ValueError(f"Invalid {mous_id[:6]} format: {mous_id}")
+    raise ValueError(f"Cannot interpret MOUS ID: {mous_id}")
+
 
 def to_db_mous_id(mous_id: str) -> str:
     """Converts a given mous_id to the database form.
@@ -26,21 +53,14 @@ def to_db_mous_id(mous_id: str) -> str:
     ValueError
         If the input MOUS ID is in an invalid format.
     """
-    mous_id = mous_id.strip()
-
-    # check if already in database form
-    if mous_id.startswith("uid://"):
-        return mous_id
+    return _to_db_mous_id(mous_id.strip())
 
-    # check if in filesystem form → convert
-    if mous_id.startswith("uid___"):
-        core = mous_id.replace("uid___", "")
-        parts = core.split("_")
-        if len(parts) != 3:
-            raise ValueError(f"Invalid uid___ format: {mous_id}")
-        return f"uid://{parts[0]}/{parts[1]}/{parts[2]}"
 
-    raise ValueError(f"Cannot interpret MOUS ID: {mous_id}")
+@lru_cache(maxsize=4096)
+def _to_db_mous_id(mous_id: str) -> str:
+    """Cached body of to_db_mous_id; expects an already-stripped MOUS ID."""
+    a, b, c = _match_mous_id(mous_id)
+    return f"uid://{a}/{b}/{c}"
 
 
 def to_dir_mous_id(mous_id: str) -> str:
@@ -64,18 +84,50 @@ def to_dir_mous_id(mous_id: str) -> str:
     ValueError
         If the input MOUS ID is in an invalid format.
     """
-    mous_id = mous_id.strip()
+    return _to_dir_mous_id(mous_id.strip())
 
-    # check if already in directory form
-    if mous_id.startswith("uid___"):
-        return mous_id
 
-    # check if in database form → convert
-    if mous_id.startswith("uid://"):
-        core = mous_id.replace("uid://", "")
-        parts = core.split("/")
-        if len(parts) != 3:
-            raise ValueError(f"Invalid uid:// format: {mous_id}")
-        return "uid___" + "_".join(parts)
+@lru_cache(maxsize=4096)
+def _to_dir_mous_id(mous_id: str) -> str:
+    """Cached body of to_dir_mous_id; expects an already-stripped MOUS ID."""
+    a, b, c = _match_mous_id(mous_id)
+    return f"uid___{a}_{b}_{c}"
 
-    raise ValueError(f"Cannot interpret MOUS ID: {mous_id}")
+
+@lru_cache(maxsize=1)
+def _format_minute(minute: int) -> str:
+    """Cached body of minute_stamp; formats one epoch minute as local time."""
+    return datetime.fromtimestamp(minute * 60).strftime("%Y%m%d-%H%M")
+
+
+def minute_stamp() -> str:
+    """Returns the current local time as a 'YYYYMMDD-HHMM' string.
+
+    The formatted string is reused for every call within the same minute, so
+    jobs submitted together get identical stamps.
+
+    Returns
+    -------
+    str
+        The current minute, formatted as 'YYYYMMDD-HHMM'.
+    """
+    return _format_minute(int(time.time() // 60))
+
+
+def make_job_name(tool: str, label: str | None = None) -> str:
+    """Builds a headless session job name, e.g. 'casa-20250101-1200-splits'.
+
+    Parameters
+    ----------
+    tool : str
+        Leading job name component (e.g. "casa", "wget2").
+    label : str | None, optional
+        Trailing job name component, by default None (omitted).
+
+    Returns
+    -------
+    str
+        The job name.
+    """
+    name = f"{tool}-{minute_stamp()}"
+    return f"{name}-{label}" if label else name
@@ -26,11 +26,12 @@ setup_path()
 # ---------------------------------------------------------------------
 # imports
 # ---------------------------------------------------------------------
-from datetime import datetime
+import asyncio
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from canfar.sessions import Session
 from prefect import flow, get_run_logger, task
 
 from alma_ops.config import (
@@ -43,12 +44,13 @@ from alma_ops.config import (
     to_vm_path,
 )
 from alma_ops.db import (
-    get_db_connection,
-    get_pipeline_state_record,
-    get_pipeline_state_record_column_value,
+    claim_mous_for_selfcal,
+    pooled_connection,
     update_pipeline_state_record,
+    update_records_bulk,
 )
-from alma_ops.utils import to_dir_mous_id
+from alma_ops.sessions import create_session_job
+from alma_ops.utils import make_job_name, to_dir_mous_id
 
 # =====================================================================
 # Configuration for Headless Session
@@ -60,16 +62,73 @@ MEM_GB = 32
 USE_FIXED_SESSION = True
 
 # =====================================================================
-# Prefect Tasks
+# Platform Script Paths (resolved once at import)
+# =====================================================================
+_RUN_AUTOSELFCAL_SCRIPT = (
+    "run_autoselfcal_fixed.sh" if USE_FIXED_SESSION else "run_autoselfcal_flexible.sh"
+)
+RUN_AUTOSELFCAL_PLATFORM = to_platform_path(
+    Path(PROJECT_ROOT)
+    / "alma-sails-codebase"
+    / "alma_ops"
+    / "autoselfcal"
+    / _RUN_AUTOSELFCAL_SCRIPT
+)
+AUTO_SELFCAL_ENTRY_SCRIPT_PLATFORM = to_platform_path(AUTO_SELFCAL_ENTRY_SCRIPT)
+
+# =====================================================================
+# Helper Functions
 # =====================================================================
 
 
-@task(name="Validate MOUS Selfcal Status")
-def validate_mous_selfcal_status(
+def _autoselfcal_session_spec(
     mous_id: str,
     db_path: str,
-):
-    """Validate that the MOUS is in the correct state to start self-calibration.
+    job_name: str,
+    img: str,
+    run_headless_autoselfcal_path: str,
+    terminal_logfile_path_prefix: str,
+    autoselfcal_entry_script: str,
+    autoselfcal_mous_dir: str,
+) -> dict:
+    """Build the `Session.create` keyword arguments for one auto_selfcal job.
+
+    Returns
+    -------
+    dict
+        Keyword arguments for `create_session_job`.
+    """
+    args = (
+        f"{mous_id} {db_path} {terminal_logfile_path_prefix} "
+        f"{autoselfcal_entry_script} {autoselfcal_mous_dir}"
+    )
+    spec = {"name": job_name, "image": img, "cmd": run_headless_autoselfcal_path}
+    if USE_FIXED_SESSION:
+        spec.update(cores=NCORES, ram=MEM_GB, args=f"{args} {NCORES} {MEM_GB}")
+    else:
+        spec["args"] = args
+    return spec
+
+
+@lru_cache(maxsize=1024)
+def _terminal_logfile_path_prefix(platform_mous_dir: str, mous_id: str) -> str:
+    """Return the terminal logfile path prefix for a MOUS auto_selfcal run."""
+    return str(
+        Path(platform_mous_dir) / (to_dir_mous_id(mous_id) + "_autoselfcal_terminal")
+    )
+
+
+# =====================================================================
+# Prefect Tasks
+# =====================================================================
+
+
+@task(name="Claim MOUS for Selfcal")
+def claim_mous_selfcal(mous_id: str, db_path: str) -> dict:
+    """Validate that the MOUS is ready for self-calibration and mark it 'in_progress'.
+
+    The status check, the 'in_progress' write (with selfcal_started_at) and the
+    read of the fields used by the flow all happen in one database transaction.
 
     Parameters
     ----------
@@ -78,34 +137,57 @@ def validate_mous_selfcal_status(
     db_path : str
         Path to the database.
 
+    Returns
+    -------
+    dict
+        The MOUS pipeline_state fields read during the claim.
+
     Raises
     ------
     ValueError
         The MOUS is not found in the database.
     ValueError
         The MOUS selfcal_status is not 'prepped'.
+    RuntimeError
+        The MOUS was claimed by another run in the meantime.
     """
     log = get_run_logger()
 
-    with get_db_connection(db_path) as conn:
-        row = get_pipeline_state_record(conn, mous_id)
+    with pooled_connection(db_path) as conn:
+        record = claim_mous_for_selfcal(conn, mous_id, expected_status="prepped")
+
+    log.info(f"[{mous_id}] MOUS selfcal_status validated as 'prepped'.")
+    log.info(f"[{mous_id}] MOUS selfcal_status set to 'in_progress'.")
+    return record
 
-    if not row:
-        raise ValueError(f"MOUS ID {mous_id} not found")
 
-    selfcal_status = row["selfcal_status"]
+@task(name="Ensure AutoSelfcal Directory", retries=2, retry_delay_seconds=[5, 15])
+async def ensure_autoselfcal_dir(mous_id: str, vm_autoselfcal_dir: str):
+    """Verify that the auto_selfcal working directory exists.
 
-    if selfcal_status != "prepped":
-        raise ValueError(
-            f"MOUS {mous_id} has selfcal_status '{selfcal_status}', expected 'prepped'"
-        )
+    The stat runs in a worker thread, so a slow sshfs mount does not block the
+    event loop; retries absorb transient mount stalls.
 
-    log.info(f"[{mous_id}] MOUS selfcal_status validated as 'prepped'.")
-    return
+    Parameters
+    ----------
+    mous_id : str
+        The MOUS ID being processed.
+    vm_autoselfcal_dir : str
+        Path to the auto_selfcal directory - VM path.
+
+    Raises
+    ------
+    FileNotFoundError
+        The auto_selfcal directory does not exist.
+    """
+    if not await asyncio.to_thread(os.path.isdir, vm_autoselfcal_dir):
+        raise FileNotFoundError(
+            f"[{mous_id}] auto_selfcal directory not found at {vm_autoselfcal_dir}"
+        )
 
 
 @task(name="Launch AutoSelfcal Job Task")
-def launch_autoselfcal_job_task(
+async def launch_autoselfcal_job_task(
     mous_id: str,
     platform_db_path: str,
     platform_mous_dir: str,
@@ -114,52 +196,30 @@ def launch_autoselfcal_job_task(
     log = get_run_logger()
 
     # creating job name and logfile paths
-    job_name = f"casa-{datetime.now().strftime('%Y%m%d-%H%M')}-autoselfcal"
+    job_name = make_job_name("casa", "autoselfcal")
 
     # setting terminal logfile path prefix
-    terminal_logfile_path_prefix = Path(platform_mous_dir) / (
-        to_dir_mous_id(mous_id) + "_autoselfcal_terminal"
+    terminal_logfile_path_prefix = _terminal_logfile_path_prefix(
+        platform_mous_dir, mous_id
     )
     log.info(
         f"[{mous_id}] Terminal logfile path prefix set as: {terminal_logfile_path_prefix}"
     )
 
-    # set path to autoselfcal script
-    if USE_FIXED_SESSION:
-        run_headless_autoselfcal_path = (
-            Path(PROJECT_ROOT)
-            / "alma-sails-codebase"
-            / "alma_ops"
-            / "autoselfcal"
-            / "run_autoselfcal_fixed.sh"
-        )
-    else:
-        run_headless_autoselfcal_path = (
-            Path(PROJECT_ROOT)
-            / "alma-sails-codebase"
-            / "alma_ops"
-            / "autoselfcal"
-            / "run_autoselfcal_flexible.sh"
-        )
-    platform_run_headless_autoselfcal_path = to_platform_path(
-        run_headless_autoselfcal_path
-    )
+    # script paths are resolved once at import
     log.info(
-        f"[{mous_id}] run_headless_autoselfcal script path set as: {platform_run_headless_autoselfcal_path}"
+        f"[{mous_id}] run_headless_autoselfcal script path set as: {RUN_AUTOSELFCAL_PLATFORM}"
     )
 
-    # set autoselfcal entry script path to be platform path
-    vm_autoselfcal_entry_script = to_platform_path(str(AUTO_SELFCAL_ENTRY_SCRIPT))
-
     # call task to launch headless session job
-    job_id = launch_autoselfcal_headless_session(
+    job_id = await launch_autoselfcal_headless_session(
         mous_id=mous_id,
         db_path=platform_db_path,
         job_name=job_name,
         img=CASA_IMAGE_PIPE,
-        run_headless_autoselfcal_path=platform_run_headless_autoselfcal_path,
-        terminal_logfile_path_prefix=str(terminal_logfile_path_prefix),
-        autoselfcal_entry_script=str(vm_autoselfcal_entry_script),
+        run_headless_autoselfcal_path=RUN_AUTOSELFCAL_PLATFORM,
+        terminal_logfile_path_prefix=terminal_logfile_path_prefix,
+        autoselfcal_entry_script=AUTO_SELFCAL_ENTRY_SCRIPT_PLATFORM,
         autoselfcal_mous_dir=platform_autoselfcal_dir,
     )
 
@@ -168,8 +228,13 @@ def launch_autoselfcal_job_task(
     return job_id[0]
 
 
-@task(name="Launch AutoSelfcal Headless Session", retries=2, retry_delay_seconds=20)
-def launch_autoselfcal_headless_session(
+@task(
+    name="Launch AutoSelfcal Headless Session",
+    retries=3,
+    retry_delay_seconds=[20, 60, 180],
+    retry_jitter_factor=0.3,
+)
+async def launch_autoselfcal_headless_session(
     mous_id: str,
     db_path: str,
     job_name: str,
@@ -181,30 +246,27 @@ def launch_autoselfcal_headless_session(
 ):
     log = get_run_logger()
 
-    # create session
-    session = Session()
-
-    # submit job
     if USE_FIXED_SESSION:
         log.info(
             f"[{mous_id}] Launching headless session with fixed resources: {NCORES} cores, {MEM_GB} GB memory"
         )
-        job_id = session.create(
-            name=job_name,
-            image=img,
-            cores=NCORES,
-            ram=MEM_GB,
-            cmd=run_headless_autoselfcal_path,
-            args=f"{mous_id} {db_path} {terminal_logfile_path_prefix} {autoselfcal_entry_script} {autoselfcal_mous_dir} {NCORES} {MEM_GB}",
-        )
     else:
         log.info(f"[{mous_id}] Launching headless session with flexible resources")
-        job_id = session.create(
-            name=job_name,
-            image=img,
-            cmd=run_headless_autoselfcal_path,
-            args=f"{mous_id} {db_path} {terminal_logfile_path_prefix} {autoselfcal_entry_script} {autoselfcal_mous_dir}",
-        )
+
+    spec = _autoselfcal_session_spec(
+        mous_id=mous_id,
+        db_path=db_path,
+        job_name=job_name,
+        img=img,
+        run_headless_autoselfcal_path=run_headless_autoselfcal_path,
+        terminal_logfile_path_prefix=terminal_logfile_path_prefix,
+        autoselfcal_entry_script=autoselfcal_entry_script,
+        autoselfcal_mous_dir=autoselfcal_mous_dir,
+    )
+
+    # submit job (the blocking API call runs in a worker thread, leaving the
+    # event loop free for other task runs)
+    job_id = await asyncio.to_thread(create_session_job, **spec)
 
     if not job_id:
         raise RuntimeError("Unsuccessful job launch.")
@@ -212,13 +274,76 @@ def launch_autoselfcal_headless_session(
     return job_id
 
 
+@task(name="Launch AutoSelfcal Batch")
+async def launch_autoselfcal_batch(
+    mous_dirs: dict[str, tuple[str, str]],
+    platform_db_path: str,
+) -> dict[str, str | BaseException]:
+    """Launch auto_selfcal headless sessions for several MOUS at once.
+
+    canfar has no batch-create endpoint, so the sessions are launched
+    concurrently rather than one after another, each through the
+    launch_autoselfcal_headless_session task (with its retries).
+
+    Parameters
+    ----------
+    mous_dirs : dict[str, tuple[str, str]]
+        Maps each MOUS ID to its (platform MOUS directory, platform auto_selfcal
+        directory).
+    platform_db_path : str
+        Path to the database - platform path.
+
+    Returns
+    -------
+    dict[str, str | BaseException]
+        Maps each MOUS ID to its launched job ID, or to the exception raised
+        when launching it.
+    """
+    log = get_run_logger()
+
+    job_name = make_job_name("casa", "autoselfcal")
+
+    log.info(f"Launching {len(mous_dirs)} auto_selfcal headless sessions...")
+    results = await asyncio.gather(
+        *(
+            launch_autoselfcal_headless_session(
+                mous_id=mous_id,
+                db_path=platform_db_path,
+                job_name=job_name,
+                img=CASA_IMAGE_PIPE,
+                run_headless_autoselfcal_path=RUN_AUTOSELFCAL_PLATFORM,
+                terminal_logfile_path_prefix=_terminal_logfile_path_prefix(
+                    platform_mous_dir, mous_id
+                ),
+                autoselfcal_entry_script=AUTO_SELFCAL_ENTRY_SCRIPT_PLATFORM,
+                autoselfcal_mous_dir=platform_autoselfcal_dir,
+            )
+            for mous_id, (platform_mous_dir, platform_autoselfcal_dir) in (
+                mous_dirs.items()
+            )
+        ),
+        return_exceptions=True,
+    )
+
+    launched = {}
+    for mous_id, job_id in zip(mous_dirs, results):
+        if isinstance(job_id, BaseException):
+            log.error(f"[{mous_id}] Failed to launch auto_selfcal job: {job_id}")
+            launched[mous_id] = job_id
+        else:
+            log.info(f"[{mous_id}] Launched auto_selfcal job with Job ID: {job_id[0]}")
+            launched[mous_id] = job_id[0]
+
+    return launched
+
+
 # =====================================================================
 # Prefect Flows
 # =====================================================================
 
 
 @flow(name="AutoSelfcal MOUS")
-def autoselfcal_mous_flow(
+async def autoselfcal_mous_flow(
     mous_id: str,
     db_path: Optional[str] = None,
     datasets_dir: Optional[str] = None,
@@ -232,41 +357,26 @@ def autoselfcal_mous_flow(
     datasets_dir = datasets_dir or DATASETS_DIR
     log.info(f"[{mous_id}] datasets_dir set as: {datasets_dir}")
 
-    # validate status in database
-    log.info(f"[{mous_id}] Validating MOUS pipeline_state statuses in database...")
-    validate_mous_selfcal_status(mous_id, db_path)
-
-    # setting the database selfcal status to 'in_progress'
-    log.info(f"[{mous_id}] Setting MOUS selfcal_status to 'in_progress'")
-    with get_db_connection(db_path) as conn:
-        update_pipeline_state_record(conn, mous_id, selfcal_status="in_progress")
+    # validate status and set it to 'in_progress' (stamping the start time of
+    # the selfcal portion of this run) in one transaction
+    log.info(f"[{mous_id}] Validating and claiming MOUS selfcal_status...")
+    record = claim_mous_selfcal(mous_id, db_path)
 
-    # organizing and creating new directories and paths
-    with get_db_connection(db_path) as conn:
-        platform_mous_dir = get_pipeline_state_record_column_value(
-            conn, mous_id, "mous_directory"
-        )
-    vm_mous_dir = to_vm_path(platform_mous_dir)
-
-    # set auto_selfcal directory paths
-    vm_autoselfcal_dir = vm_mous_dir / "auto_selfcal"
-    platform_autoselfcal_dir = to_platform_path(vm_autoselfcal_dir)
-    # verify that the auto_selfcal directory exists
-    if not vm_autoselfcal_dir.exists():
-        raise FileNotFoundError(
-            f"[{mous_id}] auto_selfcal directory not found at {vm_autoselfcal_dir}"
-        )
-
-    # # set timestamp for the selfcal portion of this run
-    # TODO: implement start time tracking with CURRENT_TIMESTAMP implementation
-    # with get_db_connection(db_path) as conn:
-    #     update_pipeline_state_record(
-    #         conn, mous_id, selfcal_started_at=datetime.now()
-    #     )
-
-    # submit job to headless session
+    # from here on the MOUS is 'in_progress', so any failure (including a
+    # missing auto_selfcal directory) must reset it to 'error'
     try:
-        launch_autoselfcal_job_task(
+        # organizing and creating new directories and paths
+        platform_mous_dir = record["mous_directory"]
+        vm_mous_dir = to_vm_path(platform_mous_dir)
+
+        # set auto_selfcal directory paths
+        vm_autoselfcal_dir = vm_mous_dir / "auto_selfcal"
+        platform_autoselfcal_dir = to_platform_path(vm_autoselfcal_dir)
+        # verify that the auto_selfcal directory exists
+        await ensure_autoselfcal_dir(mous_id, str(vm_autoselfcal_dir))
+
+        # submit job to headless session
+        await launch_autoselfcal_job_task(
             mous_id=mous_id,
             platform_db_path=to_platform_path(db_path),
             platform_mous_dir=platform_mous_dir,
@@ -275,8 +385,92 @@ def autoselfcal_mous_flow(
     except Exception as e:
         log.info(f"[{mous_id}] Updating database status to error")
         # update database status to 'error'
-        with get_db_connection(db_path) as conn:
+        with pooled_connection(db_path) as conn:
             update_pipeline_state_record(conn, mous_id, selfcal_status="error")
 
         log.error(f"[{mous_id}] AutoSelfcal failed: {e}")
         raise
+
+
+@flow(name="AutoSelfcal MOUS - Batch")
+async def autoselfcal_batch_flow(
+    mous_ids: list[str],
+    db_path: Optional[str] = None,
+):
+    """Run auto_selfcal on several MOUS, launching all their sessions together.
+
+    Each MOUS is claimed and checked on its own; a MOUS that fails either step is
+    skipped (claim failures leave the database untouched, missing directories are
+    marked 'error'). The remaining MOUS are launched in one batch.
+
+    Parameters
+    ----------
+    mous_ids : list[str]
+        The MOUS IDs to process.
+    db_path : Optional[str], optional
+        The path to the database, by default None (which uses default from config).
+
+    Raises
+    ------
+    RuntimeError
+        One or more MOUS could not be claimed or launched.
+    """
+    log = get_run_logger()
+
+    db_path = db_path or DB_PATH
+    log.info(f"db_path set as: {db_path}")
+
+    failed = []
+    mous_dirs = {}
+    for mous_id in mous_ids:
+        try:
+            record = claim_mous_selfcal(mous_id, db_path)
+        except Exception as e:
+            log.error(f"[{mous_id}] Could not claim MOUS for selfcal: {e}")
+            failed.append(mous_id)
+            continue
+
+        platform_mous_dir = record["mous_directory"]
+        vm_autoselfcal_dir = to_vm_path(platform_mous_dir) / "auto_selfcal"
+        mous_dirs[mous_id] = (platform_mous_dir, vm_autoselfcal_dir)
+
+    # verify every auto_selfcal directory exists (checked concurrently)
+    checks = await asyncio.gather(
+        *(
+            ensure_autoselfcal_dir(mous_id, str(vm_dir))
+            for mous_id, (_, vm_dir) in mous_dirs.items()
+        ),
+        return_exceptions=True,
+    )
+    errored = []
+    for mous_id, check in zip(list(mous_dirs), checks):
+        if isinstance(check, BaseException):
+            log.error(str(check))
+            errored.append(mous_id)
+            del mous_dirs[mous_id]
+        else:
+            platform_mous_dir, vm_dir = mous_dirs[mous_id]
+            mous_dirs[mous_id] = (platform_mous_dir, to_platform_path(vm_dir))
+
+    if mous_dirs:
+        launched = await launch_autoselfcal_batch(
+            mous_dirs, platform_db_path=to_platform_path(db_path)
+        )
+        errored += [
+            mous_id
+            for mous_id, job_id in launched.items()
+            if isinstance(job_id, BaseException)
+        ]
+
+    if errored:
+        log.info(f"Updating database status to error for {len(errored)} MOUS")
+        with pooled_connection(db_path) as conn:
+            update_records_bulk(
+                conn,
+                "pipeline_state",
+                [(mous_id, {"selfcal_status": "error"}) for mous_id in errored],
+            )
+
+    failed += errored
+    if failed:
+        raise RuntimeError(f"AutoSelfcal batch failed for MOUS: {', '.join(failed)}")
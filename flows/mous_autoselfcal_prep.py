@@ -26,11 +26,10 @@ setup_path()
 # ---------------------------------------------------------------------
 # imports
 # ---------------------------------------------------------------------
-from datetime import datetime
+import asyncio
 from pathlib import Path
 from typing import Optional
 
-from canfar.sessions import Session
 from prefect import flow, get_run_logger, task
 
 from alma_ops.config import (
@@ -42,11 +41,24 @@ from alma_ops.config import (
     to_vm_path,
 )
 from alma_ops.db import (
-    get_db_connection,
-    get_pipeline_state_record,
-    get_pipeline_state_record_column_value,
+    get_pipeline_state,
+    parse_json_safe,
+    pooled_connection,
     update_pipeline_state_record,
 )
+from alma_ops.sessions import create_session_job
+from alma_ops.utils import make_job_name
+
+# =====================================================================
+# Platform Script Paths (resolved once at import)
+# =====================================================================
+RUN_AUTOSELFCAL_PREP_PLATFORM = to_platform_path(
+    Path(PROJECT_ROOT)
+    / "alma-sails-codebase"
+    / "alma_ops"
+    / "autoselfcal"
+    / "run_autoselfcal_prep.sh"
+)
 
 # =====================================================================
 # Prefect Tasks
@@ -56,7 +68,7 @@ from alma_ops.db import (
 @task(name="Validate MOUS Selfcal Status")
 def validate_mous_selfcal_status(
     mous_id: str,
-    db_path: str,
+    state: Optional[tuple],
 ):
     """Validate that the MOUS is in the correct state to start self-calibration.
 
@@ -64,8 +76,8 @@ def validate_mous_selfcal_status(
     ----------
     mous_id : str
         The MOUS ID to validate.
-    db_path : str
-        Path to the database.
+    state : Optional[tuple]
+        The MOUS PipelineState read by the flow (None if not found).
 
     Raises
     ------
@@ -78,26 +90,19 @@ def validate_mous_selfcal_status(
     """
     log = get_run_logger()
 
-    with get_db_connection(db_path) as conn:
-        row = get_pipeline_state_record(conn, mous_id)
-
-    if not row:
+    if not state:
         raise ValueError(f"MOUS ID {mous_id} not found")
 
-    preselfcal_listobs_status = row["pre_selfcal_listobs_status"]
-
-    if preselfcal_listobs_status != "complete":
+    if state.pre_selfcal_listobs_status != "complete":
         raise ValueError(
-            f"MOUS {mous_id} has pre_selfcal_listobs_status '{preselfcal_listobs_status}', expected 'complete'"
+            f"MOUS {mous_id} has pre_selfcal_listobs_status '{state.pre_selfcal_listobs_status}', expected 'complete'"
         )
 
     log.info(f"[{mous_id}] MOUS pre_selfcal_listobs_status validated as 'complete'.")
 
-    selfcal_status = row["selfcal_status"]
-
-    if selfcal_status != "pending":
+    if state.selfcal_status != "pending":
         raise ValueError(
-            f"MOUS {mous_id} has selfcal_status '{selfcal_status}', expected 'pending'"
+            f"MOUS {mous_id} has selfcal_status '{state.selfcal_status}', expected 'pending'"
         )
 
     log.info(f"[{mous_id}] MOUS selfcal_status validated as 'pending'.")
@@ -105,7 +110,7 @@ def validate_mous_selfcal_status(
 
 
 @task(name="Launch AutoSelfcal Prep Job Task")
-def launch_autoselfcal_prep_job_task(
+async def launch_autoselfcal_prep_job_task(
     mous_id: str,
     db_path: str,
     autoselfcal_mous_dir: str,
@@ -132,32 +137,22 @@ def launch_autoselfcal_prep_job_task(
     log = get_run_logger()
 
     # creating job name
-    job_name = f"wget2-{datetime.now().strftime('%Y%m%d-%H%M')}-autoselfcal-prep"
-
-    run_headless_autoselfcal_prep_path = (
-        Path(PROJECT_ROOT)
-        / "alma-sails-codebase"
-        / "alma_ops"
-        / "autoselfcal"
-        / "run_autoselfcal_prep.sh"
-    )
-    platform_run_headless_autoselfcal_path = to_platform_path(
-        run_headless_autoselfcal_prep_path
-    )
+    job_name = make_job_name("wget2", "autoselfcal-prep")
+
     log.info(
-        f"[{mous_id}] Autoselfcal prep script path set as: {platform_run_headless_autoselfcal_path}"
+        f"[{mous_id}] Autoselfcal prep script path set as: {RUN_AUTOSELFCAL_PREP_PLATFORM}"
     )
 
     # use platform based path for db
     platform_db_path = to_platform_path(Path(db_path))
 
     # call task to launch headless session job
-    job_id = launch_autoselfcal_prep_headless_session(
+    job_id = await launch_autoselfcal_prep_headless_session(
         mous_id=mous_id,
         db_path=platform_db_path,
         job_name=job_name,
         img=WGET2_IMAGE,
-        run_headless_autoselfcal_prep_path=platform_run_headless_autoselfcal_path,
+        run_headless_autoselfcal_prep_path=RUN_AUTOSELFCAL_PREP_PLATFORM,
         autoselfcal_mous_dir=autoselfcal_mous_dir,
         split_products_paths=split_products_paths,
     )
@@ -167,8 +162,13 @@ def launch_autoselfcal_prep_job_task(
     return job_id[0]
 
 
-@task(name="Launch AutoSelfcal Prep Headless Session")
-def launch_autoselfcal_prep_headless_session(
+@task(
+    name="Launch AutoSelfcal Prep Headless Session",
+    retries=3,
+    retry_delay_seconds=[20, 60, 180],
+    retry_jitter_factor=0.3,
+)
+async def launch_autoselfcal_prep_headless_session(
     mous_id: str,
     db_path: str,
     job_name: str,
@@ -208,17 +208,19 @@ def launch_autoselfcal_prep_headless_session(
     """
     log = get_run_logger()
 
-    # create session
-    session = Session()
-
     # construct argument based on fixed and variable inputs
     args = " ".join(
         [mous_id, str(db_path), autoselfcal_mous_dir] + split_products_paths
     )
 
-    # submit job
-    job_id = session.create(
-        name=job_name, image=img, cmd=run_headless_autoselfcal_prep_path, args=args
+    # submit job (the blocking API call runs in a worker thread, leaving the
+    # event loop free for other task runs)
+    job_id = await asyncio.to_thread(
+        create_session_job,
+        name=job_name,
+        image=img,
+        cmd=run_headless_autoselfcal_prep_path,
+        args=args,
     )
 
     if not job_id:
@@ -233,7 +235,7 @@ def launch_autoselfcal_prep_headless_session(
 
 
 @flow(name="AutoSelfcal MOUS - Prep")
-def autoselfcal_prep_flow(
+async def autoselfcal_prep_flow(
     mous_id: str,
     db_path: Optional[str] = None,
     datasets_dir: Optional[str] = None,
@@ -258,15 +260,25 @@ def autoselfcal_prep_flow(
     datasets_dir = datasets_dir or DATASETS_DIR
     log.info(f"[{mous_id}] datasets_dir set as: {datasets_dir}")
 
+    # read everything this flow needs from pipeline_state in one query
+    with pooled_connection(db_path) as conn:
+        state = get_pipeline_state(
+            conn,
+            mous_id,
+            cols=(
+                "pre_selfcal_listobs_status",
+                "selfcal_status",
+                "mous_directory",
+                "split_products_path",
+            ),
+        )
+
     # validate status in database
     log.info(f"[{mous_id}] Validating MOUS selfcal status in database...")
-    validate_mous_selfcal_status(mous_id=mous_id, db_path=db_path)
+    validate_mous_selfcal_status(mous_id=mous_id, state=state)
 
     # creating new directories and paths
-    with get_db_connection(db_path) as conn:
-        platform_mous_dir = get_pipeline_state_record_column_value(
-            conn, mous_id, "mous_directory"
-        )
+    platform_mous_dir = state.mous_directory
 
     vm_mous_dir = to_vm_path(platform_mous_dir)
 
@@ -276,14 +288,11 @@ def autoselfcal_prep_flow(
     platform_autoselfcal_dir = to_platform_path(vm_autoselfcal_dir)
 
     # gather split products paths
-    with get_db_connection(db_path) as conn:
-        split_products = get_pipeline_state_record_column_value(
-            conn, mous_id, "split_products_path"
-        )
+    split_products = parse_json_safe(state.split_products_path)
 
     # submit job to headless session
     try:
-        launch_autoselfcal_prep_job_task(
+        await launch_autoselfcal_prep_job_task(
             mous_id=mous_id,
             db_path=db_path,
             autoselfcal_mous_dir=platform_autoselfcal_dir,
@@ -292,7 +301,7 @@ def autoselfcal_prep_flow(
 
     except Exception as e:
         log.info(f"[{mous_id}] Updating database status to error")
-        with get_db_connection(db_path) as conn:
+        with pooled_connection(db_path) as conn:
             update_pipeline_state_record(conn, mous_id, selfcal_status="error")
 
         log.error(f"[{mous_id}] Failed to launch autoselfcal prep job: {e}")
@@ -17,6 +17,8 @@ Overview of Prefect Flow:
 1. Validate MOUS status is 'pending' and has a valid download URL.
 2. Update database status to 'in_progress'.
 3. Launch headless session to run wget2 download command.
+4. Wait for the session to finish, holding a slot of the 'srdp-download'
+   global concurrency limit while it runs.
 """
 # ruff: noqa: E402
 
@@ -30,14 +32,15 @@ setup_path()
 # ---------------------------------------------------------------------
 # imports
 # ---------------------------------------------------------------------
-import os
+import asyncio
+import random
 import tempfile
 import time
-from datetime import datetime
 from typing import Optional
 
-from canfar.sessions import Session
+import httpx
 from prefect import flow, get_run_logger, task
+from prefect.concurrency.asyncio import concurrency
 
 from alma_ops.config import (
     DATASETS_DIR,
@@ -48,19 +51,238 @@ from alma_ops.config import (
     to_platform_path,
 )
 from alma_ops.db import (
-    get_db_connection,
     get_pipeline_state_record,
+    get_pipeline_state_records,
+    pooled_connection,
     update_pipeline_state_record,
+    update_pipeline_status_if,
 )
-from alma_ops.utils import to_dir_mous_id
+from alma_ops.sessions import create_session_job, get_session_info
+from alma_ops.utils import make_job_name, to_dir_mous_id
+from mous_post_download_organize import organize_mous_download
+
+# =====================================================================
+# Platform Script Paths (resolved once at import)
+# =====================================================================
+RUN_DOWNLOAD_PLATFORM = to_platform_path(
+    PROJECT_ROOT / "alma-sails-codebase" / "alma_ops" / "downloads" / "run_download.sh"
+)
+
+# =====================================================================
+# Configuration for Download Concurrency
+# =====================================================================
+# global concurrency limit capping simultaneous wget2 sessions against the SRDP
+# server; it must be created (`prefect gcl create srdp-download --limit 5`)
+# before any download runs, as the flow refuses to start without it
+SRDP_DOWNLOAD_LIMIT = "srdp-download"
+
+# =====================================================================
+# Configuration for Headless Session Monitoring
+# =====================================================================
+# session.info() polling backs off exponentially (with jitter) between these
+# bounds, so long downloads are not polled at a fixed short cadence; the delay
+# drops back to the initial value whenever the job changes status
+POLL_INITIAL_DELAY_S = 5
+POLL_MAX_DELAY_S = 120
+POLL_BACKOFF_FACTOR = 2
+POLL_JITTER_FRACTION = 0.25
+
+
+async def _poll_sleep(delay: float) -> float:
+    """Sleeps for delay (+/- jitter), and returns the next (backed-off) delay."""
+    jitter = random.uniform(-POLL_JITTER_FRACTION, POLL_JITTER_FRACTION)
+    await asyncio.sleep(delay * (1 + jitter))
+    return min(POLL_MAX_DELAY_S, delay * POLL_BACKOFF_FACTOR)
+
+
+def _log_event(log, mous_id: str, event: str, **fields):
+    """Logs one structured event line, instead of one log call per field.
+
+    The fields are rendered into the message (what the Prefect UI shows) and
+    also attached as `extra` for structured handlers.
+    """
+    details = ", ".join(f"{k}={v}" for k, v in fields.items())
+    log.info(
+        f"[{mous_id}] {event}: {details}", extra={"mous_id": mous_id, **fields}
+    )
+
+
+# =====================================================================
+# Shared Job Watcher
+# =====================================================================
+TERMINAL_STATUSES = ("Succeeded", "Failed", "Terminated")
+# consecutive empty responses (per job) or transient API errors tolerated
+MAX_EMPTY_RESPONSES = 3
+# wall-clock limit on watching a single download job
+MAX_DOWNLOAD_SECONDS = 12 * 3600
+# a just-launched job may not be listed yet (CANFAR scheduling lag is often
+# well over 10s), so until it first shows up it is probed on a short fixed
+# interval for about 150s, longer than the old 10s wait plus 3 empty polls
+STARTUP_PROBE_DELAY_S = 5
+MAX_STARTUP_PROBES = 30
+
+
+class DownloadJobFailed(RuntimeError):
+    """The download job itself ended as Failed or Terminated."""
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Whether a session.info() error is worth retrying.
+
+    Network-level failures, timeouts, 429s and 5xx responses are transient;
+    anything else (auth failures, 4xx such as an unknown job ID, bad responses)
+    will not fix itself and is raised at once.
+    """
+    if isinstance(exc, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        code = exc.response.status_code
+        return code == 429 or code >= 500
+    return False
+
+
+class JobWatcher:
+    """Polls every watched headless session with one session.info() call per cycle.
+
+    Download monitors in the same process (and event loop) register their job
+    IDs through `wait`, so N in-flight jobs cost one API call per poll instead
+    of N. The poll interval uses the jittered backoff above, reset whenever any
+    watched job changes status. Jobs still running after MAX_DOWNLOAD_SECONDS
+    fail with a TimeoutError.
+    """
+
+    _instance: Optional["JobWatcher"] = None
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._pending: dict[str, asyncio.Future] = {}
+        self._deadlines: dict[str, float] = {}
+        # last seen status and consecutive empty responses, per watched job
+        self._statuses: dict[str, str] = {}
+        self._empty_counts: dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def instance(cls) -> "JobWatcher":
+        """Returns the watcher for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if cls._instance is None or cls._instance._loop is not loop:
+            cls._instance = cls()
+        return cls._instance
+
+    async def wait(self, job_id: str) -> str:
+        """Waits for a job to reach a terminal status, and returns that status."""
+        future = self._pending.get(job_id)
+        if future is None:
+            future = self._pending[job_id] = self._loop.create_future()
+            self._deadlines[job_id] = time.monotonic() + MAX_DOWNLOAD_SECONDS
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        # shield, so one cancelled waiter does not cancel the shared future
+        return await asyncio.shield(future)
+
+    def _resolve(self, job_id: str, status: str | None = None, error=None):
+        """Completes (and stops watching) a job's future."""
+        future = self._pending.pop(job_id)
+        self._deadlines.pop(job_id, None)
+        self._statuses.pop(job_id, None)
+        self._empty_counts.pop(job_id, None)
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(status)
+
+    async def _run(self):
+        """Runs the poll loop, failing every waiter if it stops unexpectedly."""
+        try:
+            await self._poll()
+        except BaseException as e:
+            for job_id in list(self._pending):
+                self._resolve(job_id, error=RuntimeError(f"Job watcher failed: {e!r}"))
+            # the waiters now carry the error; only re-raise cancellation
+            if not isinstance(e, Exception):
+                raise
+
+    async def _poll(self):
+        """Polls until no job is left to watch."""
+        delay = POLL_INITIAL_DELAY_S
+        statuses = self._statuses
+        empty_counts = self._empty_counts
+        failed_calls = 0
+
+        while self._pending:
+            job_ids = list(self._pending)
+            try:
+                infos = await asyncio.to_thread(get_session_info, ids=job_ids)
+            except Exception as e:
+                # transient errors are retried, until too many consecutive failures
+                failed_calls += 1
+                if not _is_transient(e) or failed_calls >= MAX_EMPTY_RESPONSES:
+                    # fail every waiter, including jobs registered during the
+                    # call, since this loop is exiting and will not poll them
+                    for job_id in list(self._pending):
+                        self._resolve(job_id, error=e)
+                    return
+                delay = await _poll_sleep(delay)
+                continue
+            failed_calls = 0
+
+            infos_by_id = {info["id"]: info for info in infos or ()}
+            for job_id in job_ids:
+                info = infos_by_id.get(job_id)
+                if info is None:
+                    empty_counts[job_id] = empty_counts.get(job_id, 0) + 1
+                    seen = job_id in statuses
+                    max_empty = MAX_EMPTY_RESPONSES if seen else MAX_STARTUP_PROBES
+                    if empty_counts[job_id] >= max_empty:
+                        self._resolve(
+                            job_id,
+                            error=RuntimeError(
+                                f"Job {job_id} returned empty info "
+                                f"{max_empty} times - may have expired "
+                                "or been deleted"
+                            ),
+                        )
+                    continue
+                empty_counts[job_id] = 0
+
+                # a status change means a job is progressing, so poll closely again
+                status = info["status"]
+                if statuses.get(job_id) != status:
+                    statuses[job_id] = status
+                    delay = POLL_INITIAL_DELAY_S
+
+                if status in TERMINAL_STATUSES:
+                    self._resolve(job_id, status)
+                elif time.monotonic() > self._deadlines[job_id]:
+                    self._resolve(
+                        job_id,
+                        error=TimeoutError(
+                            f"Job {job_id} still '{status}' after "
+                            f"{MAX_DOWNLOAD_SECONDS}s"
+                        ),
+                    )
+
+            if any(job_id not in statuses for job_id in self._pending):
+                await asyncio.sleep(STARTUP_PROBE_DELAY_S)
+            elif self._pending:
+                delay = await _poll_sleep(delay)
+
 
 # =====================================================================
 # Prefect Tasks
 # =====================================================================
 
 
-@task(name="Launch Headless Download Session", retries=2, retry_delay_seconds=60)
-def launch_download_headless_session(
+@task(
+    name="Launch Headless Download Session",
+    retries=3,
+    retry_delay_seconds=[20, 60, 180],
+    retry_jitter_factor=0.3,
+)
+async def launch_download_headless_session(
     mous_id: str,
     db_path: str,
     job_name: str,
@@ -97,12 +319,10 @@ def launch_download_headless_session(
     RuntimeError
         If the job launch was unsuccessful.
     """
-    log = get_run_logger()
-
-    # initialize the session
-    session = Session()
-
-    job_id = session.create(
+    # submit job (the blocking API call runs in a worker thread, leaving the
+    # event loop free for other task runs)
+    job_id = await asyncio.to_thread(
+        create_session_job,
         name=job_name,
         image=img,
         cmd=cmd,
@@ -116,9 +336,9 @@ def launch_download_headless_session(
 
 
 @task(name="Launch Download Job")
-def launch_download_job_task(
-    mous_id: str, url: str, download_dir: str, db_path: str
-) -> tuple[str, str]:
+async def launch_download_job_task(
+    mous_id: str, url: str, tmpdir: str, db_path: str
+) -> str:
     """Calls the task that launches the headless session to run the download.
 
     Parameters
@@ -127,137 +347,107 @@ def launch_download_job_task(
         The MOUS ID.
     url : str
         The download URL.
-    download_dir : str
-        The base directory to create the temporary download directory in.
+    tmpdir : str
+        The temporary directory to download into - VM path.
     db_path : str
         Path to the SQLite database.
 
     Returns
     -------
-    tuple[str, str]
-        The launched job ID and the temporary directory path.
+    str
+        The launched job ID.
     """
     log = get_run_logger()
 
-    # creating temp directory
-    tmpdir = tempfile.mkdtemp(prefix=f"{to_dir_mous_id(mous_id)}_", dir=download_dir)
-    log.info(f"[{mous_id}] Creating temporary directory: {tmpdir}")
-    os.makedirs(tmpdir, exist_ok=True)
-
     # creating job name for headless session
-    job_name = f"wget2-{datetime.now().strftime('%Y%m%d-%H%M')}"
-
-    # for headless sessions: use platform-native paths
-    log.info(f"[{mous_id}] Setting platform-native paths for headless session launch")
+    job_name = make_job_name("wget2")
 
+    # for headless sessions: use platform-native paths (the download script
+    # path is resolved once at import)
     platform_tmpdir = to_platform_path(tmpdir)
-    log.info(f"[{mous_id}] Platform tmpdir location set as: {platform_tmpdir}")
-
-    # setting path to download script - relative to PROJECT_ROOT
-    run_download_script_filepath = to_platform_path(
-        str(
-            PROJECT_ROOT
-            / "alma-sails-codebase"
-            / "alma_ops"
-            / "downloads"
-            / "run_download.sh"
-        )
-    )
-    log.info(
-        f"[{mous_id}] Platform download script location set as: {run_download_script_filepath}"
-    )
     platform_db_path = to_platform_path(db_path)
-    log.info(f"[{mous_id}] Platform db_path location set as: {platform_db_path}")
-
-    # updating database to contain the tmpdir in the mous_directory spot
-    # so that the organize files script can read where the data is
-    with get_db_connection(db_path) as conn:
-        update_pipeline_state_record(conn, mous_id, mous_directory=f"{platform_tmpdir}")
 
     # call task to launch headless session
-    job_id = launch_download_headless_session(
+    job_id = await launch_download_headless_session(
         mous_id=mous_id,
         db_path=platform_db_path,
         job_name=job_name,
         img=WGET2_IMAGE,
-        cmd=run_download_script_filepath,
+        cmd=RUN_DOWNLOAD_PLATFORM,
         tmpdir=platform_tmpdir,
         url=url,
     )
 
-    log.info(f"[{mous_id}] Launched download job: {job_id[0]}")
-    return job_id[0], tmpdir
+    _log_event(
+        log,
+        mous_id,
+        "Launched download job",
+        job_id=job_id[0],
+        job_name=job_name,
+        tmpdir=platform_tmpdir,
+        script=RUN_DOWNLOAD_PLATFORM,
+        db_path=platform_db_path,
+        url=url,
+    )
+    return job_id[0]
 
 
 @task(name="Monitor Download Headless Session")
-def monitor_download_headless_session(job_id: str, mous_id: str):
-    """Monitor the headless session for its end state."""
-    log = get_run_logger()
-
-    # initialize the session
-    session = Session()
+async def monitor_download_headless_session(job_id: str, mous_id: str):
+    """Monitor the headless session for its end state.
 
-    # initiate response tracking
-    log.info(f"[{mous_id}] Setting response tracking values...")
-    consecutive_empty_responses = 0
-    max_empty_responses = 3  # allows some transient failures
+    The job is handed to the process-wide JobWatcher, which polls all watched
+    jobs with one session.info() call per cycle, starting right away (a job
+    not listed yet is re-probed every STARTUP_PROBE_DELAY_S seconds).
 
-    # start with waiting - helps the session get into the API calls
-    log.info(f"[{mous_id}] Pre-wait period before first session.info() call.")
-    time.sleep(10)
+    Raises
+    ------
+    DownloadJobFailed
+        The job ended as Failed/Terminated.
+    RuntimeError
+        The job returned empty info too often.
+    TimeoutError
+        The job did not finish within MAX_DOWNLOAD_SECONDS.
+    Exception
+        session.info() failed with a non-transient error, or with transient
+        errors too many times in a row.
+    """
+    log = get_run_logger()
 
-    while True:
-        try:
-            # query job status
-            log.info(f"[{mous_id}] Conducting API call through session.info().")
-            session_info = session.info(ids=job_id)
-
-            if not session_info:
-                # tally the empty response
-                consecutive_empty_responses += 1
-                log.warning(f"[{mous_id}] Empty response from session.info()")
-                log.warning(f"{consecutive_empty_responses}/{max_empty_responses}")
-
-                # if too many consecutive failures, something is wrong
-                if consecutive_empty_responses >= max_empty_responses:
-                    raise RuntimeError(
-                        f"Job {job_id} returned empty info {max_empty_responses} times - may have expired or been deleted"
-                    )
+    log.info(f"[{mous_id}] Watching job {job_id} until it finishes...")
+    status = await JobWatcher.instance().wait(job_id)
+    log.info(f"[{mous_id}] Job completed with status: {status}")
 
-                # wait and retry for next check
-                time.sleep(60)
-                continue
+    if status != "Succeeded":
+        raise DownloadJobFailed(f"Job failed with status: {status}")
+    return True
 
-            # reset counter on successful response
-            consecutive_empty_responses = 0
 
-            # now we check the status
-            status = session_info[0]["status"]
-            log.debug(f"[{mous_id}] Job status: {status}")
+_DOWNLOAD_STATE_COLS = ("download_status", "download_url")
 
-            if status in ["Succeeded", "Failed", "Terminated"]:
-                log.info(f"Job completed with status: {status}")
 
-                if status == "Succeeded":
-                    return True
-                else:
-                    raise RuntimeError(f"Job failed with status: {status}")
+def _check_download_record(mous_id: str, row) -> str:
+    """Checks that a MOUS is 'pending' with a download URL, and returns the URL.
 
-        except Exception as e:
-            log.error(f"[{mous_id}] Error checking job status: {e}")
+    Raises
+    ------
+    ValueError
+        The MOUS is not found, is not 'pending', or has no download URL.
+    """
+    if not row:
+        raise ValueError(f"MOUS ID {mous_id} not found")
 
-            # don't retry on known errors
-            if isinstance(e, (RuntimeError)):
-                raise
+    download_status = row["download_status"]
+    if download_status != "pending":
+        raise ValueError(
+            f"MOUS {mous_id} has status '{download_status}', expected 'pending'"
+        )
 
-            # for other errors, wait and retry
-            consecutive_empty_responses += 1
-            if consecutive_empty_responses >= max_empty_responses:
-                raise
+    url = row["download_url"]
+    if not url:
+        raise ValueError(f"No download URL for {mous_id}")
 
-        # wait before next check
-        log.debug(f"[{mous_id}] Waiting 60s before next check...")
-        time.sleep(60)
+    return url
 
 
 @task(name="Validate Download and URL Values")
@@ -288,33 +478,18 @@ def validate_mous_download_status(mous_id: str, db_path: str) -> tuple[str, str]
     log = get_run_logger()
 
     # gather the mous_id record
-    with get_db_connection(db_path) as conn:
-        row = get_pipeline_state_record(conn, mous_id)
-
-    if not row:
-        raise ValueError(f"MOUS ID {mous_id} not found")
-
-    download_status = row["download_status"]
-
-    if download_status != "pending":
-        log.warning(
-            f"[{mous_id}] Status is '{download_status}', not 'pending'. Skipping download."
-        )
-        raise ValueError(
-            f"MOUS {mous_id} has status '{download_status}', expected 'pending'"
-        )
-
-    log.info(f"[{mous_id}] download_status status validated as 'pending'.")
-
-    # Get URL
-    url = row["download_url"]
+    with pooled_connection(db_path) as conn:
+        row = get_pipeline_state_record(conn, mous_id, cols=_DOWNLOAD_STATE_COLS)
 
-    if not url:
-        raise ValueError(f"No download URL for {mous_id}")
+    try:
+        url = _check_download_record(mous_id, row)
+    except ValueError as e:
+        log.warning(f"[{mous_id}] {e}. Skipping download.")
+        raise
 
-    log.info(f"[{mous_id}] Found download URL: {url}")
+    _log_event(log, mous_id, "Validated download", download_status="pending", url=url)
 
-    return download_status, url
+    return row["download_status"], url
 
 
 # =====================================================================
@@ -323,14 +498,21 @@ def validate_mous_download_status(mous_id: str, db_path: str) -> tuple[str, str]
 
 
 @flow(name="Download MOUS")
-def download_mous_flow(
+async def download_mous_flow(
     mous_id: str,
     db_path: Optional[str] = None,
     download_dir: Optional[str] = None,
     weblog_dir: Optional[str] = None,
+    url: Optional[str] = None,
 ):
     """Prefect flow to download a MOUS dataset.
 
+    The flow holds a slot of the srdp-download concurrency limit, and runs until
+    the wget2 session finishes (at most MAX_DOWNLOAD_SECONDS). The download
+    script records 'downloaded' or 'error' itself; the flow only sets 'error'
+    when the launch fails or the job reports failure, and never over a status
+    the script has already written.
+
     Parameters
     ----------
     mous_id : str
@@ -341,36 +523,71 @@ def download_mous_flow(
         Directory to download the dataset to, by default None (will use default from config).
     weblog_dir : Optional[str], optional
         Directory for weblog files, by default None (will use default from config).
+    url : Optional[str], optional
+        Download URL of a MOUS already validated by the caller, by default None
+        (the status and URL are validated from the database). Either way the
+        MOUS is claimed ('pending' -> 'in_progress') just before launch.
+
+    Raises
+    ------
+    ValueError
+        The MOUS is not downloadable, or is no longer 'pending' at launch.
     """
     log = get_run_logger()
 
     # parsing input parameters
-    log.info(f"[{mous_id}] Parsing input variables...")
     db_path = db_path or DB_PATH
-    log.info(f"[{mous_id}] db_path set as: {db_path}")
     download_dir = download_dir or DATASETS_DIR
-    log.info(f"[{mous_id}] download_dir set as: {download_dir}")
     weblog_dir = weblog_dir or SRDP_WEBLOG_DIR
-    log.info(f"[{mous_id}] weblog_dir set as: {weblog_dir}")
+    _log_event(
+        log,
+        mous_id,
+        "Download flow inputs",
+        db_path=db_path,
+        download_dir=download_dir,
+        weblog_dir=weblog_dir,
+    )
 
-    # validation steps
-    log.info(f"[{mous_id}] Validating mous pipeline_state status...")
-    download_status, url = validate_mous_download_status(mous_id, db_path)
+    # validation steps (skipped when a batch caller already validated this MOUS)
+    if url is None:
+        log.info(f"[{mous_id}] Validating mous pipeline_state status...")
+        download_status, url = validate_mous_download_status(mous_id, db_path)
 
-    # updating database to in_progress
-    log.info(f"[{mous_id}] Updating database status to in_progress")
-    with get_db_connection(db_path) as conn:
-        update_pipeline_state_record(conn, mous_id, download_status="in_progress")
+    # claim the MOUS right before launching: the validation above (or a batch
+    # caller's) may be hours old, and another run may have started it since
+    with pooled_connection(db_path) as conn:
+        claimed = update_pipeline_status_if(
+            conn, mous_id, "download_status", "in_progress", "pending"
+        )
+    if not claimed:
+        log.warning(f"[{mous_id}] No longer 'pending'. Skipping download.")
+        raise ValueError(f"MOUS {mous_id} is no longer 'pending'")
 
     # submit job to headless session
+    job_id = None
     try:
-        # calling task to launch job
-        log.info(f"[{mous_id}] Calling task to launch download job...")
-        job_id, tmpdir = launch_download_job_task(mous_id, url, download_dir, db_path)
+        # creating temp directory (mkdtemp creates it, no separate makedirs needed)
+        tmpdir = await asyncio.to_thread(
+            tempfile.mkdtemp, prefix=f"{to_dir_mous_id(mous_id)}_", dir=download_dir
+        )
+        log.info(f"[{mous_id}] Created {tmpdir}; download_status is in_progress")
+
+        # the tmpdir goes in the mous_directory spot so that the organize files
+        # script can read where the data is
+        with pooled_connection(db_path) as conn:
+            update_pipeline_state_record(
+                conn, mous_id, mous_directory=to_platform_path(tmpdir)
+            )
 
-        # # monitor the headless session
-        # log.info(f'[{mous_id}] Monitoring headless job...')
-        # status_flag = monitor_download_job(job_id, mous_id)
+        # the SRDP link is the bottleneck, so a slot of the srdp-download limit
+        # is held for as long as the wget2 session runs (strict: a missing limit
+        # raises instead of silently leaving downloads ungated)
+        async with concurrency(SRDP_DOWNLOAD_LIMIT, occupy=1, strict=True):
+            # calling task to launch job
+            job_id = await launch_download_job_task(mous_id, url, tmpdir, db_path)
+
+            # monitor the headless session
+            await monitor_download_headless_session(job_id, mous_id)
 
         # # if status is completed, then organize the files
         # if status_flag:
@@ -379,14 +596,14 @@ def download_mous_flow(
         #     calibrated_products, _, _ = organize_downloaded_files(mous_id, tmpdir, download_dir, weblog_dir)
 
         #     # updating database with mous_directory and calibrated products
-        #     with get_db_connection(db_path) as conn:
+        #     with pooled_connection(db_path) as conn:
         #         # grab the mous_directory
         #         mous_directory_path = to_dir_mous_id(mous_id)
         #         set_mous_directory(conn, mous_id, mous_directory_path)
         #         set_calibrated_products(conn, mous_id, calibrated_products)
 
         #     log.info(f'[{mous_id}] Updating database status to completed')
-        #     with get_db_connection(db_path) as conn:
+        #     with pooled_connection(db_path) as conn:
         #         set_download_status_complete(conn, mous_id, timestamp=True)
 
         #     # removing temporary directory after files have been moved
@@ -394,9 +611,109 @@ def download_mous_flow(
         # shutil.rmtree(tmpdir)
 
     except Exception as e:
-        log.info(f"[{mous_id}] Updating database status to error")
-        with get_db_connection(db_path) as conn:
-            update_pipeline_state_record(conn, mous_id, download_status="error")
+        if job_id is None or isinstance(e, DownloadJobFailed):
+            # only over our own 'in_progress', never over the script's status
+            log.info(f"[{mous_id}] Updating database status to error")
+            with pooled_connection(db_path) as conn:
+                update_pipeline_status_if(
+                    conn, mous_id, "download_status", "error", "in_progress"
+                )
+        else:
+            # watching failed, but the job may still be running (or done) and
+            # its script records the outcome; leave download_status to it
+            log.warning(
+                f"[{mous_id}] Lost track of download job {job_id}; "
+                "download_status is left to the download script"
+            )
 
         log.error(f"[{mous_id}] Download failed: {e}")
         raise
+
+
+@flow(name="Download MOUS - Batch")
+async def download_mous_batch_flow(
+    mous_ids: list[str],
+    db_path: Optional[str] = None,
+    download_dir: Optional[str] = None,
+    weblog_dir: Optional[str] = None,
+):
+    """Prefect flow to download several MOUS datasets, organizing as it goes.
+
+    Every MOUS is validated up front from a single pipeline_state query. The
+    valid ones are then downloaded one after another, and each finished download
+    is organized (organize_mous_download, in a worker thread) in the background.
+    Organize steps run one at a time; the only overlap is between the organize
+    step of one MOUS and the download of the next.
+
+    Parameters
+    ----------
+    mous_ids : list[str]
+        The MOUS IDs to download.
+    db_path : Optional[str], optional
+        Path to the SQLite database, by default None (will use default from config).
+    download_dir : Optional[str], optional
+        Directory to download the datasets to, by default None (will use default from config).
+    weblog_dir : Optional[str], optional
+        Directory for weblog files, by default None (will use default from config).
+
+    Raises
+    ------
+    RuntimeError
+        One or more MOUS failed to download or organize.
+    """
+    log = get_run_logger()
+
+    db_path = db_path or DB_PATH
+    download_dir = download_dir or DATASETS_DIR
+    weblog_dir = weblog_dir or SRDP_WEBLOG_DIR
+
+    organize_slot = asyncio.Semaphore(1)
+
+    async def organize(mous_id: str):
+        async with organize_slot:
+            log.info(f"[{mous_id}] Organizing downloaded files...")
+            # organizing is sync (file moves), so it runs in a worker thread
+            await asyncio.to_thread(
+                organize_mous_download, mous_id, db_path, download_dir, weblog_dir
+            )
+
+    # validate every MOUS with one query
+    with pooled_connection(db_path) as conn:
+        rows = get_pipeline_state_records(conn, mous_ids, cols=_DOWNLOAD_STATE_COLS)
+
+    failed = []
+    urls = {}
+    for mous_id in mous_ids:
+        try:
+            urls[mous_id] = _check_download_record(mous_id, rows.get(mous_id))
+        except ValueError as e:
+            log.warning(f"[{mous_id}] {e}. Skipping download.")
+            failed.append(mous_id)
+    log.info(f"Validated {len(urls)}/{len(mous_ids)} MOUS for download.")
+
+    organizing = {}
+    for mous_id, url in urls.items():
+        try:
+            await download_mous_flow(
+                mous_id,
+                db_path=db_path,
+                download_dir=download_dir,
+                weblog_dir=weblog_dir,
+                url=url,
+            )
+        except Exception as e:
+            log.error(f"[{mous_id}] Download failed, skipping organize: {e}")
+            failed.append(mous_id)
+            continue
+
+        # start organizing in the background and move on to the next download
+        organizing[mous_id] = asyncio.create_task(organize(mous_id))
+
+    results = await asyncio.gather(*organizing.values(), return_exceptions=True)
+    for mous_id, result in zip(organizing, results):
+        if isinstance(result, BaseException):
+            log.error(f"[{mous_id}] Organize failed: {result}")
+            failed.append(mous_id)
+
+    if failed:
+        raise RuntimeError(f"Download batch failed for MOUS: {', '.join(failed)}")
@@ -24,7 +24,11 @@ setup_path()
 # ---------------------------------------------------------------------
 # imports
 # ---------------------------------------------------------------------
+import fnmatch
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -35,9 +39,9 @@ from alma_ops.config import (
     to_vm_path,
 )
 from alma_ops.db import (
-    get_db_connection,
     get_pipeline_state_record,
     get_pipeline_state_record_column_value,
+    pooled_connection,
     update_pipeline_state_record,
 )
 
@@ -55,6 +59,23 @@ KEEP_PATTERNS = [
     "weblog",
     "casa*.log",
 ]
+# all keep patterns as one compiled regex, matched against entry names
+KEEP_RE = re.compile("|".join(fnmatch.translate(p) for p in KEEP_PATTERNS))
+
+# deletions on the mounted filesystem are latency-bound, so they run in parallel
+_MAX_DELETE_WORKERS = 8
+
+
+def _delete_one(item: tuple[str, bool]):
+    """Remove one (path, is_dir) entry; already-missing paths are ignored."""
+    path, is_dir = item
+    try:
+        if is_dir:
+            shutil.rmtree(path)
+        else:
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
 
 # =====================================================================
 # Prefect Tasks
@@ -82,8 +103,8 @@ def validate_mous_selfcal_status(
     ValueError
         If the MOUS ID does not have a 'selfcaled' status.
     """
-    with get_db_connection(db_path) as conn:
-        record = get_pipeline_state_record(conn, mous_id)
+    with pooled_connection(db_path) as conn:
+        record = get_pipeline_state_record(conn, mous_id, cols=("selfcal_status",))
 
         if record is None:
             raise ValueError(f"MOUS ID {mous_id} not found in database.")
@@ -105,6 +126,10 @@ def cleanup(
 ):
     """Clean up task.
 
+    Only the top level of mous_dir is examined: entries matching KEEP_PATTERNS
+    are left untouched (contents included), and every other entry is removed
+    whole, without walking into it first.
+
     Parameters
     ----------
     mous_dir : str
@@ -112,25 +137,23 @@ def cleanup(
     dry_run : bool
         If True, perform a dry run without deleting files.
     """
-
-    # iterate over all patterns and build set of files to keep
-    keep_files = set()
-    for pattern in KEEP_PATTERNS:
-        keep_files.update(mous_dir.glob(pattern))
-
-    # build the set of all items
-    all_items = set(mous_dir.rglob("*"))
-
-    # determine items to delete
-    delete_items = all_items - keep_files
+    # one directory read; everything not kept at the top level goes, subtrees
+    # included (scandir's DirEntry carries the entry type, so no per-entry stat)
+    with os.scandir(mous_dir) as it:
+        delete_items = sorted(
+            (entry.path, entry.is_dir(follow_symlinks=False))
+            for entry in it
+            if not KEEP_RE.fullmatch(entry.name)
+        )
 
     if dry_run:
-        for item in delete_items:
-            print(f"[DRY RUN] Would delete: {item}")
+        for path, _ in delete_items:
+            print(f"[DRY RUN] Would delete: {path}")
 
-    else:
-        for item in sorted(delete_items, reverse=True):
-            shutil.rmtree(item) if item.is_dir() else item.unlink()
+    elif delete_items:
+        workers = min(_MAX_DELETE_WORKERS, len(delete_items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_delete_one, delete_items))
 
     return
 
@@ -171,7 +194,7 @@ def post_autoselfcal_organize_flow(
     validate_mous_selfcal_status(mous_id, db_path)
 
     # get the mous_directory entry from the database
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         mous_directory = get_pipeline_state_record_column_value(
             conn, mous_id, "mous_directory"
         )
@@ -200,23 +223,19 @@ def post_autoselfcal_organize_flow(
         cleanup(Path(vm_autoselfcal_dir), dry_run=False)
 
     # get all *_target.ms files in the auto_selfcal directory
-    target_ms_files = list(vm_autoselfcal_dir.glob("*_targets.ms"))
-
-    # update database to set selfcal_products_nonsub_path
-    with get_db_connection(db_path) as conn:
-        update_pipeline_state_record(
-            conn, mous_id, selfcal_products_nonsub_path=target_ms_files
-        )
+    target_ms_files = [str(p) for p in vm_autoselfcal_dir.glob("*_targets.ms")]
 
     # get all *_target.contsub.ms files in the auto_selfcal directory
-    target_contsub_ms_files = list(vm_autoselfcal_dir.glob("*_targets.contsub.ms"))
+    target_contsub_ms_files = [
+        str(p) for p in vm_autoselfcal_dir.glob("*_targets.contsub.ms")
+    ]
 
-    # update database to set selfcal_products_sub_path
-    with get_db_connection(db_path) as conn:
+    # update database with both product paths and mark as 'complete' in one UPDATE
+    with pooled_connection(db_path) as conn:
         update_pipeline_state_record(
-            conn, mous_id, selfcal_products_sub_path=target_contsub_ms_files
+            conn,
+            mous_id,
+            selfcal_products_nonsub_path=target_ms_files,
+            selfcal_products_sub_path=target_contsub_ms_files,
+            selfcal_status="complete",
         )
-
-    # update database to mark as 'complete'
-    with get_db_connection(db_path) as conn:
-        update_pipeline_state_record(conn, mous_id, selfcal_status="complete")
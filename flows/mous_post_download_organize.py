@@ -26,8 +26,12 @@ setup_path()
 # ---------------------------------------------------------------------
 # imports
 # ---------------------------------------------------------------------
+import errno
+import logging
 import os
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -41,12 +45,115 @@ from alma_ops.config import (
     to_vm_path,
 )
 from alma_ops.db import (
-    get_db_connection,
     get_pipeline_state_record,
+    pooled_connection,
     update_pipeline_state_record,
 )
 from alma_ops.utils import to_dir_mous_id
 
+# =====================================================================
+# Helpers
+# =====================================================================
+
+# cap on concurrent cross-filesystem moves, to avoid thrashing the destination
+_MAX_MOVE_WORKERS = 8
+
+# numbered line in the organize directory listings: "  1. <path>"
+_LINE_FMT = "  {}. {}".format
+
+# chunk size for in-kernel copies in _fast_copyfile
+_COPY_CHUNK = 1 << 20  # 1 MiB
+
+# copy_file_range errors that mean "not supported here", not a real failure
+_NO_COPY_RANGE_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL}
+)
+
+
+def _fast_copyfile(src: str, dst: str) -> str:
+    """Copies file contents with copy_file_range(2), skipping copystat.
+
+    Falls back to shutil.copyfile (sendfile on Linux) where copy_file_range is
+    unavailable or refused for this pair of filesystems.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        return shutil.copyfile(src, dst)
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        mode = os.fstat(src_fd).st_mode & 0o777
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            while copy_range(src_fd, dst_fd, _COPY_CHUNK):
+                pass
+        except OSError as e:
+            if e.errno not in _NO_COPY_RANGE_ERRNOS:
+                raise
+            os.close(dst_fd)
+            dst_fd = None
+            return shutil.copyfile(src, dst)
+        finally:
+            if dst_fd is not None:
+                os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    return dst
+
+
+def _cross_fs_move(src: str, dst: str):
+    """Moves src to a new dst on another filesystem: fast copy, then delete."""
+    if os.path.isdir(src) and not os.path.islink(src):
+        shutil.copytree(src, dst, symlinks=True, copy_function=_fast_copyfile)
+        shutil.rmtree(src)
+    else:
+        _fast_copyfile(src, dst)
+        os.unlink(src)
+
+
+def _fast_move(src: str, dst: str, same_fs: bool = True):
+    """Moves src to dst with a single rename(2) when possible.
+
+    Across filesystems the tree is copied with copy_file_range and then
+    removed. When dst already exists, shutil.move moves src inside it.
+    """
+    if os.path.exists(dst):
+        shutil.move(src, dst)
+        return
+
+    if same_fs:
+        try:
+            os.rename(src, dst)
+            return
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.ENOTSUP):
+                raise
+    _cross_fs_move(src, dst)
+
+
+def _move_all(srcs: list[str], dest_root: str, same_fs: bool) -> list[str]:
+    """Moves each src into dest_root, returning the destination paths in order.
+
+    Same-filesystem moves are single renames and run serially; copying moves
+    (across filesystems) are independent trees, so they run on a thread pool.
+    """
+    dests = [os.path.join(dest_root, os.path.basename(src)) for src in srcs]
+
+    if same_fs or len(srcs) < 2:
+        for src, dst in zip(srcs, dests):
+            _fast_move(src, dst, same_fs=same_fs)
+        return dests
+
+    workers = min(_MAX_MOVE_WORKERS, os.cpu_count() or 1, len(srcs))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = [
+            ex.submit(_fast_move, src, dst, False) for src, dst in zip(srcs, dests)
+        ]
+        for f in futures:
+            f.result()
+    return dests
+
+
 # =====================================================================
 # Prefect Tasks
 # =====================================================================
@@ -70,7 +177,7 @@ def organize_downloaded_files(
     tmpdir : str
         Path to the temporary download directory holding downloaded files.
     weblog_dir : str
-        Path to the weblog_restore directory.
+        Path to the weblog_restore directory (created here if any weblogs exist).
 
     Returns
     -------
@@ -83,39 +190,61 @@ def organize_downloaded_files(
 
     # initialize lists
     ms_dirs, weblog_dirs = [], []
-    for root, dirs, files in os.walk(tmpdir):
-        for d in list(dirs):
-            if d.endswith(".ms"):
-                ms_dirs.append(os.path.join(root, d))
-                dirs.remove(d)
-            elif d == "weblog_restore":
-                weblog_dirs.append(os.path.join(root, d))
-                dirs.remove(d)
-
-    ms_dirs = sorted(set(ms_dirs))
-    log.info(
-        f"Found {len(ms_dirs)} .ms directories:\n"
-        + "\n".join(f"  {i + 1}. {ms}" for i, ms in enumerate(ms_dirs))
-    )
-    weblog_dirs = sorted(set(weblog_dirs))
-    log.info(
-        f"Found {len(weblog_dirs)} weblog_restore directories:\n"
-        + "\n".join(f"  {i + 1}. {wb}" for i, wb in enumerate(weblog_dirs))
-    )
+
+    # breadth-first scandir walk over the whole tree (a MOUS can hold more
+    # ASDMs than expected, and anything left behind is lost with the tmpdir);
+    # matched directories are recorded and never descended into, and
+    # DirEntry.is_dir() reuses the cached d_type (no stat)
+    # (bound methods are hoisted out of the per-entry loop)
+    pending = deque([tmpdir])
+    next_dir, push_dir = pending.popleft, pending.append
+    add_ms, add_weblog = ms_dirs.append, weblog_dirs.append
+    while pending:
+        with os.scandir(next_dir()) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                name = entry.name
+                if name.endswith(".ms"):
+                    add_ms(entry.path)
+                elif name == "weblog_restore":
+                    add_weblog(entry.path)
+                else:
+                    push_dir(entry.path)
+
+    # the walk never yields a path twice, so no dedup is needed; sort in place
+    # to keep the stored product order deterministic
+    ms_dirs.sort()
+    weblog_dirs.sort()
+
+    # the per-directory listings are only built when INFO is actually emitted
+    if log.isEnabledFor(logging.INFO):
+        log.info(
+            "Found %d .ms directories:\n%s",
+            len(ms_dirs),
+            "\n".join(map(_LINE_FMT, range(1, len(ms_dirs) + 1), ms_dirs)),
+        )
+        log.info(
+            "Found %d weblog_restore directories:\n%s",
+            len(weblog_dirs),
+            "\n".join(map(_LINE_FMT, range(1, len(weblog_dirs) + 1), weblog_dirs)),
+        )
 
     calibrate_products_paths = []
 
+    # a rename only works within one filesystem, so check that once up front
+    tmpdir_dev = os.stat(tmpdir).st_dev
+
     if ms_dirs:
-        for ms in ms_dirs:
-            dest = Path(mous_dir) / Path(ms).name
-            shutil.move(ms, dest)
-            calibrate_products_paths.append(str(dest))
+        same_fs = tmpdir_dev == os.stat(mous_dir).st_dev
+        calibrate_products_paths = _move_all(ms_dirs, mous_dir, same_fs)
         log.info(f"[{mous_id}] Moved {len(ms_dirs)} .ms → {mous_dir}")
 
     if weblog_dirs:
-        for wb in weblog_dirs:
-            dest = Path(weblog_dir) / Path(wb).name
-            shutil.move(wb, dest)
+        # only created once there is a weblog to put in it
+        os.makedirs(weblog_dir, exist_ok=True)
+        same_fs = tmpdir_dev == os.stat(weblog_dir).st_dev
+        _move_all(weblog_dirs, weblog_dir, same_fs)
         log.info(f"[{mous_id}] Moved {len(weblog_dirs)} weblog_restore → {weblog_dir}")
 
     return calibrate_products_paths
@@ -149,8 +278,10 @@ def validate_mous_download_status(mous_id: str, db_path: str) -> str:
     log = get_run_logger()
 
     # gather the mous_id record
-    with get_db_connection(db_path) as conn:
-        row = get_pipeline_state_record(conn, mous_id)
+    with pooled_connection(db_path) as conn:
+        row = get_pipeline_state_record(
+            conn, mous_id, cols=("download_status", "mous_directory")
+        )
 
     if not row:
         raise ValueError(f"MOUS ID {mous_id} not found")
@@ -175,41 +306,35 @@ def validate_mous_download_status(mous_id: str, db_path: str) -> str:
 
 
 # =====================================================================
-# Prefect Flows
+# Organize Steps
 # =====================================================================
 
 
-@flow(name="Post Download Organize")
-def post_download_organize_flow(
+def organize_mous_download(
     mous_id: str,
-    db_path: Optional[str] = None,
-    datasets_dir: Optional[str] = None,
-    weblog_dir: Optional[str] = None,
+    db_path: str,
+    datasets_dir: str,
+    weblog_dir: str,
 ):
-    """Prefect flow to organize downloaded files for a MOUS ID.
+    """Runs the post-download organize steps for a MOUS ID.
+
+    This is the body of post_download_organize_flow as a plain function, so
+    callers that already run inside a flow (download_mous_batch_flow) can run
+    it in a worker thread without starting a nested flow run from that thread.
 
     Parameters
     ----------
     mous_id : str
         The MOUS ID.
-    db_path : Optional[str], optional
-        Path to the SQLite database, by default None (which uses default from config).
-    datasets_dir : Optional[str], optional
-        Path to the datasets directory, by default None (which uses default from config).
-    weblog_dir : Optional[str], optional
-        Path to the weblog directory, by default None (which uses default from config).
+    db_path : str
+        Path to the SQLite database.
+    datasets_dir : str
+        Path to the datasets directory.
+    weblog_dir : str
+        Path to the weblog directory.
     """
     log = get_run_logger()
 
-    # parsing input parameters
-    log.info(f"[{mous_id}] Parsing input variables...")
-    db_path = db_path or DB_PATH
-    log.info(f"[{mous_id}] db_path set as: {db_path}")
-    datasets_dir = datasets_dir or DATASETS_DIR
-    log.info(f"[{mous_id}] datasets_dir set as: {datasets_dir}")
-    weblog_dir = weblog_dir or SRDP_WEBLOG_DIR
-    log.info(f"[{mous_id}] weblog_dir set as: {weblog_dir}")
-
     # validate status is 'downloaded'
     log.info(f"[{mous_id}] Validating mous pipeline_state status...")
     tmpdir = validate_mous_download_status(mous_id, db_path)
@@ -222,38 +347,28 @@ def post_download_organize_flow(
     mous_dir.mkdir(parents=True, exist_ok=True)
     log.info(f"[{mous_id}] Created MOUS directory at: {mous_dir}")
 
-    # create the appropriate weblog_dir
+    # the weblog_dir is created by the organize step, only if weblogs were found
     weblog_mous_dir = Path(weblog_dir) / to_dir_mous_id(mous_id)
-    weblog_mous_dir.mkdir(parents=True, exist_ok=True)
-    log.info(f"[{mous_id}] Created weblog_restore directory at: {weblog_mous_dir}")
+    log.info(f"[{mous_id}] weblog_restore directory set as: {weblog_mous_dir}")
 
     # organizing downloaded files
     log.info(f"[{mous_id}] Organizing downloaded files...")
     calibrated_products = organize_downloaded_files(
-        mous_id, str(mous_dir), str(tmpdir), str(weblog_mous_dir)
+        mous_id,
+        str(mous_dir),
+        str(tmpdir),
+        str(weblog_mous_dir),
     )
 
     # updating database with mous_directory, calibrated_products, and complete state
-    with get_db_connection(db_path) as conn:
-        # convert mous_directory to platform path for database storage
-        platform_mous_directory = to_platform_path(mous_dir)
-        update_pipeline_state_record(
-            conn,
-            mous_id,
-            mous_directory=platform_mous_directory,
-        )
-        # convert calibrated_products to platform paths for database storage
-        platform_calibrated_products = to_platform_path(calibrated_products)
-        update_pipeline_state_record(
-            conn,
-            mous_id,
-            calibrated_products=platform_calibrated_products,
-        )
-
-        # finally setting download_status to complete
+    # (one UPDATE, so the three fields land in a single commit)
+    with pooled_connection(db_path) as conn:
         update_pipeline_state_record(
             conn,
             mous_id,
+            # convert paths to platform paths for database storage
+            mous_directory=to_platform_path(mous_dir),
+            calibrated_products=to_platform_path(calibrated_products),
             download_status="complete",
         )
     log.info(
@@ -266,3 +381,42 @@ def post_download_organize_flow(
     # shutil.rmtree(tmpdir)
 
     log.info(f"✅ Post Download Organize Completed: {mous_id}")
+
+
+# =====================================================================
+# Prefect Flows
+# =====================================================================
+
+
+@flow(name="Post Download Organize")
+def post_download_organize_flow(
+    mous_id: str,
+    db_path: Optional[str] = None,
+    datasets_dir: Optional[str] = None,
+    weblog_dir: Optional[str] = None,
+):
+    """Prefect flow to organize downloaded files for a MOUS ID.
+
+    Parameters
+    ----------
+    mous_id : str
+        The MOUS ID.
+    db_path : Optional[str], optional
+        Path to the SQLite database, by default None (which uses default from config).
+    datasets_dir : Optional[str], optional
+        Path to the datasets directory, by default None (which uses default from config).
+    weblog_dir : Optional[str], optional
+        Path to the weblog directory, by default None (which uses default from config).
+    """
+    log = get_run_logger()
+
+    # parsing input parameters
+    log.info(f"[{mous_id}] Parsing input variables...")
+    db_path = db_path or DB_PATH
+    log.info(f"[{mous_id}] db_path set as: {db_path}")
+    datasets_dir = datasets_dir or DATASETS_DIR
+    log.info(f"[{mous_id}] datasets_dir set as: {datasets_dir}")
+    weblog_dir = weblog_dir or SRDP_WEBLOG_DIR
+    log.info(f"[{mous_id}] weblog_dir set as: {weblog_dir}")
+
+    organize_mous_download(mous_id, db_path, datasets_dir, weblog_dir)
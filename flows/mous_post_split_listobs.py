@@ -31,7 +31,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from canfar.sessions import Session
 from prefect import flow, get_run_logger, task
 
 from alma_ops.config import (
@@ -42,12 +41,27 @@ from alma_ops.config import (
     to_platform_path,
 )
 from alma_ops.db import (
-    get_db_connection,
     get_pipeline_state_record,
     get_pipeline_state_record_column_value,
+    pooled_connection,
     update_pipeline_state_record,
 )
-from alma_ops.utils import to_dir_mous_id
+from alma_ops.sessions import get_session
+from alma_ops.utils import make_job_name, to_dir_mous_id
+
+# =====================================================================
+# Platform Script Paths (resolved once at import)
+# =====================================================================
+RUN_LISTOBS_PLATFORM = to_platform_path(
+    Path(PROJECT_ROOT)
+    / "alma-sails-codebase"
+    / "alma_ops"
+    / "listobs"
+    / "run_listobs.sh"
+)
+CASA_DRIVER_PLATFORM = to_platform_path(
+    Path(PROJECT_ROOT) / "alma-sails-codebase" / "alma_ops" / "casa_driver.py"
+)
 
 # =====================================================================
 # Prefect Tasks
@@ -59,8 +73,12 @@ def validate_mous_split_status(mous_id: str, db_path: str):
     log = get_run_logger()
 
     # first check for 'complete' status on pre_selfcal_split_status
-    with get_db_connection(db_path) as conn:
-        row = get_pipeline_state_record(conn, mous_id)
+    with pooled_connection(db_path) as conn:
+        row = get_pipeline_state_record(
+            conn,
+            mous_id,
+            cols=("pre_selfcal_split_status", "pre_selfcal_listobs_status"),
+        )
 
         if not row:
             raise ValueError(f"MOUS ID not found: {mous_id}")
@@ -158,12 +176,17 @@ def json_write_payload(
     payload: dict,
     output_path: Path,
 ):
-    """Write the JSON payload to a file."""
+    """Write the JSON payload to a file as NDJSON (one task per line)."""
     log = get_run_logger()
     log.info(f"Writing JSON payload to {output_path}...")
 
+    # NDJSON: a metadata header line, then one line per task, so the casa
+    # driver can start executing before it has parsed the whole file
+    header = {k: v for k, v in payload.items() if k != "tasks"}
     with open(output_path, "w") as f:
-        json.dump(payload, f, indent=4)
+        f.write(json.dumps(header) + "\n")
+        for job_task in payload["tasks"]:
+            f.write(json.dumps(job_task) + "\n")
 
     log.info(f"[{payload['mous_id']}] Wrote task file → {output_path}")
     return
@@ -200,7 +223,7 @@ def launch_listobs_job_task(
     log = get_run_logger()
 
     # creating job name and logfile paths
-    job_name = f"casa-{datetime.now().strftime('%Y%m%d-%H%M')}-listobs"
+    job_name = make_job_name("casa", "listobs")
     casa_logfile_name = f"casa-{datetime.now().strftime('%Y%m%d-%H%M%S')}-listobs.log"
     casa_logfile_path = Path(platform_mous_dir) / casa_logfile_name
     log.info(f"[{mous_id}] Logfile path: {casa_logfile_path}")
@@ -213,23 +236,9 @@ def launch_listobs_job_task(
         f"[{mous_id}] Terminal logfile path prefix: {terminal_logfile_path_prefix}"
     )
 
-    # set run headless listobs script path - relative to PROJECT_ROOT
-    run_headless_listobs_path = (
-        Path(PROJECT_ROOT)
-        / "alma-sails-codebase"
-        / "alma_ops"
-        / "listobs"
-        / "run_listobs.sh"
-    )
-    platform_run_headless_listobs_path = to_platform_path(run_headless_listobs_path)
-    log.info(f"[{mous_id}] run_listobs.sh path: {platform_run_headless_listobs_path}")
-
-    # set casa driver script path
-    casa_driver_path = (
-        Path(PROJECT_ROOT) / "alma-sails-codebase" / "alma_ops" / "casa_driver.py"
-    )
-    platform_casa_driver_path = to_platform_path(casa_driver_path)
-    log.info(f"[{mous_id}] CASA driver path set as: {platform_casa_driver_path}")
+    # script paths are resolved once at import
+    log.info(f"[{mous_id}] run_listobs.sh path: {RUN_LISTOBS_PLATFORM}")
+    log.info(f"[{mous_id}] CASA driver path set as: {CASA_DRIVER_PLATFORM}")
 
     # call task to launch headless session
     job_id = launch_headless_listobs_session(
@@ -237,10 +246,10 @@ def launch_listobs_job_task(
         db_path=platform_db_path,
         job_name=job_name,
         img=img,
-        run_headless_listobs_script_path=platform_run_headless_listobs_path,
+        run_headless_listobs_script_path=RUN_LISTOBS_PLATFORM,
         terminal_logfile_path_prefix=str(terminal_logfile_path_prefix),
         casa_logfile_path=casa_logfile_path,
-        casa_driver_script_path=platform_casa_driver_path,
+        casa_driver_script_path=CASA_DRIVER_PLATFORM,
         json_payload_path=json_payload_path,
     )
 
@@ -296,7 +305,7 @@ def launch_headless_listobs_session(
     log = get_run_logger()
 
     # create session manager
-    session = Session()
+    session = get_session()
 
     # submit job
     job_id = session.create(
@@ -336,7 +345,7 @@ def post_split_listobs_flow(
 
     # setting database status to 'in_progress'
     log.info(f"[{mous_id}] Setting pre_selfcal_listobs_status to 'in_progress'...")
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         update_pipeline_state_record(
             conn,
             mous_id,
@@ -345,7 +354,7 @@ def post_split_listobs_flow(
 
     # fetch calibrated product locations and split product locations
     log.info(f"[{mous_id}] Fetching calibrated and split product locations...")
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         calibrated_products_path = get_pipeline_state_record_column_value(
             conn, mous_id, "calibrated_products"
         )
@@ -357,14 +366,14 @@ def post_split_listobs_flow(
     log.info(f"[{mous_id}] Split products path: {split_products_path}")
 
     if not calibrated_products_path:
-        with get_db_connection(db_path) as conn:
+        with pooled_connection(db_path) as conn:
             update_pipeline_state_record(
                 conn, mous_id, pre_selfcal_listobs_status="error"
             )
         raise ValueError(f"No calibrated products for MOUS {mous_id}")
 
     if not split_products_path:
-        with get_db_connection(db_path) as conn:
+        with pooled_connection(db_path) as conn:
             update_pipeline_state_record(
                 conn, mous_id, pre_selfcal_listobs_status="error"
             )
@@ -385,8 +394,9 @@ def post_split_listobs_flow(
     )
 
     # write JSON payload to file
-    vm_mous_dir = Path(datasets_dir) / to_dir_mous_id(mous_id)
-    json_path = vm_mous_dir / f"{to_dir_mous_id(mous_id)}_listobs.json"
+    dir_mous_id = to_dir_mous_id(mous_id)
+    vm_mous_dir = Path(datasets_dir) / dir_mous_id
+    json_path = vm_mous_dir / f"{dir_mous_id}_listobs.ndjson"
     json_write_payload(
         payload=payload,
         output_path=json_path,
@@ -404,7 +414,7 @@ def post_split_listobs_flow(
 
     except Exception as e:
         log.info(f"[{mous_id}] Error launching headless listobs job: {e}")
-        with get_db_connection(db_path) as conn:
+        with pooled_connection(db_path) as conn:
             update_pipeline_state_record(
                 conn, mous_id, pre_selfcal_listobs_status="error"
             )
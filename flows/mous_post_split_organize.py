@@ -36,9 +36,9 @@ from alma_ops.config import (
     to_vm_path,
 )
 from alma_ops.db import (
-    get_db_connection,
     get_pipeline_state_record,
     get_pipeline_state_record_column_value,
+    pooled_connection,
     update_pipeline_state_record,
 )
 
@@ -69,8 +69,10 @@ def validate_mous_split_status(
         If the MOUS ID does not have a 'split' status.
     """
 
-    with get_db_connection(db_path) as conn:
-        record = get_pipeline_state_record(conn, mous_id)
+    with pooled_connection(db_path) as conn:
+        record = get_pipeline_state_record(
+            conn, mous_id, cols=("pre_selfcal_split_status",)
+        )
 
         if record is None:
             raise ValueError(f"MOUS ID {mous_id} not found in database.")
@@ -119,7 +121,7 @@ def post_split_organize_flow(
 
     # verify split products exist
     log.info(f"[{mous_id}] Verifying split products exist...")
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         split_products = get_pipeline_state_record_column_value(
             conn, mous_id, "split_products_path"
         )
@@ -134,12 +136,12 @@ def post_split_organize_flow(
 
     # update database to mark as 'complete'
     log.info(f"[{mous_id}] Updating database to mark as 'complete'...")
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         update_pipeline_state_record(conn, mous_id, pre_selfcal_split_status="complete")
 
     # remove calibrated_products
     log.info(f"[{mous_id}] Removing calibrated_products from the mous directory...")
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         calibrated_products = get_pipeline_state_record_column_value(
             conn, mous_id, "calibrated_products"
         )
@@ -36,7 +36,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from canfar.sessions import Session
 from prefect import flow, get_run_logger, task
 
 from alma_ops.config import (
@@ -47,13 +46,24 @@ from alma_ops.config import (
     to_platform_path,
 )
 from alma_ops.db import (
-    get_db_connection,
     get_mous_spw_mapping,
     get_pipeline_state_record,
     get_pipeline_state_record_column_value,
+    pooled_connection,
     update_pipeline_state_record,
 )
-from alma_ops.utils import to_dir_mous_id
+from alma_ops.sessions import get_session
+from alma_ops.utils import make_job_name, to_dir_mous_id
+
+# =====================================================================
+# Platform Script Paths (resolved once at import)
+# =====================================================================
+RUN_SPLIT_PLATFORM = to_platform_path(
+    Path(PROJECT_ROOT) / "alma-sails-codebase" / "alma_ops" / "splits" / "run_split.sh"
+)
+CASA_DRIVER_PLATFORM = to_platform_path(
+    Path(PROJECT_ROOT) / "alma-sails-codebase" / "alma_ops" / "casa_driver.py"
+)
 
 # =====================================================================
 # Prefect Tasks
@@ -82,8 +92,10 @@ def validate_mous_preselfcal_split_status(mous_id: str, db_path: str):
     """
     log = get_run_logger()
 
-    with get_db_connection(db_path) as conn:
-        row = get_pipeline_state_record(conn, mous_id)
+    with pooled_connection(db_path) as conn:
+        row = get_pipeline_state_record(
+            conn, mous_id, cols=("pre_selfcal_split_status", "download_status")
+        )
 
     if not row:
         raise ValueError(f"MOUS ID {mous_id} not found")
@@ -151,7 +163,7 @@ def build_split_job_payload(
     log.info(f"[{mous_id}] Building split job payload...")
 
     # get spw mapping from database
-    with get_db_connection(vm_db_path) as conn:
+    with pooled_connection(vm_db_path) as conn:
         spws = get_mous_spw_mapping(conn, mous_id)
 
         if not spws:
@@ -160,7 +172,7 @@ def build_split_job_payload(
         log.info(f"[{mous_id}] Science SPWs found: {spws}")
 
     # get preferred datacolumn
-    with get_db_connection(vm_db_path) as conn:
+    with pooled_connection(vm_db_path) as conn:
         preferred_datacolumn = get_pipeline_state_record_column_value(
             conn, mous_id, "preferred_datacolumn"
         )
@@ -215,7 +227,7 @@ def json_write_payload(
     payload: dict,
     output_path: Path,
 ):
-    """Write the JSON payload to a file.
+    """Write the JSON payload to a file as NDJSON (one task per line).
 
     Parameters
     ----------
@@ -227,8 +239,13 @@ def json_write_payload(
     log = get_run_logger()
     log.info(f"[{payload['mous_id']}] Writing job payload to {output_path}...")
 
+    # NDJSON: a metadata header line, then one line per task, so the casa
+    # driver can start executing before it has parsed the whole file
+    header = {k: v for k, v in payload.items() if k != "tasks"}
     with open(output_path, "w") as f:
-        json.dump(payload, f, indent=4)
+        f.write(json.dumps(header) + "\n")
+        for job_task in payload["tasks"]:
+            f.write(json.dumps(job_task) + "\n")
     log.info(f"[{payload['mous_id']}] Wrote task file → {output_path}")
     return
 
@@ -264,7 +281,7 @@ def launch_split_job_task(
     log = get_run_logger()
 
     # creating job name and logfile paths
-    job_name = f"casa-{datetime.now().strftime('%Y%m%d-%H%M')}-splits"
+    job_name = make_job_name("casa", "splits")
     casa_logfile_name = f"casa-{datetime.now().strftime('%Y%m%d-%H%M%S')}-splits.log"
     casa_logfile_path = Path(mous_dir) / casa_logfile_name
     log.info(f"[{mous_id}] Logfile path set as: {casa_logfile_path}")
@@ -277,25 +294,11 @@ def launch_split_job_task(
         f"[{mous_id}] Terminal logfile path prefix set as: {terminal_logfile_path_prefix}"
     )
 
-    # set path to split script - relative to PROJECT_ROOT
-    run_headless_split_path = (
-        Path(PROJECT_ROOT)
-        / "alma-sails-codebase"
-        / "alma_ops"
-        / "splits"
-        / "run_split.sh"
-    )
-    platform_run_headless_split_path = to_platform_path(run_headless_split_path)
+    # script paths are resolved once at import
     log.info(
-        f"[{mous_id}] Run headless split script path set as: {platform_run_headless_split_path}"
-    )
-
-    # set casa driver script path
-    casa_driver_path = (
-        Path(PROJECT_ROOT) / "alma-sails-codebase" / "alma_ops" / "casa_driver.py"
+        f"[{mous_id}] Run headless split script path set as: {RUN_SPLIT_PLATFORM}"
     )
-    platform_casa_driver_path = to_platform_path(casa_driver_path)
-    log.info(f"[{mous_id}] CASA driver path set as: {platform_casa_driver_path}")
+    log.info(f"[{mous_id}] CASA driver path set as: {CASA_DRIVER_PLATFORM}")
 
     # call task to launch headless session
     job_id = launch_split_headless_session(
@@ -303,10 +306,10 @@ def launch_split_job_task(
         db_path=db_path,
         job_name=job_name,
         img=CASA_IMAGE_PIPE,
-        run_headless_split_path=platform_run_headless_split_path,
+        run_headless_split_path=RUN_SPLIT_PLATFORM,
         terminal_logfile_path_prefix=str(terminal_logfile_path_prefix),
         casa_logfile_path=casa_logfile_path,
-        casa_driver_script_path=platform_casa_driver_path,
+        casa_driver_script_path=CASA_DRIVER_PLATFORM,
         json_payload_path=json_payload_path,
     )
 
@@ -363,7 +366,7 @@ def launch_split_headless_session(
     log = get_run_logger()
 
     # create session
-    session = Session()
+    session = get_session()
 
     # submit job
     job_id = session.create(
@@ -416,20 +419,20 @@ def split_mous_flow(
 
     # setting database splitting status to in_progress
     log.info(f"[{mous_id}] Updating database status to in_progress")
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         update_pipeline_state_record(
             conn, mous_id, pre_selfcal_split_status="in_progress"
         )
 
     # fetch calibrated product locations
     log.info(f"[{mous_id}] Fetching calibrated product locations from database...")
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         calibrated_products = get_pipeline_state_record_column_value(
             conn, mous_id, "calibrated_products"
         )
 
     if not calibrated_products:
-        with get_db_connection(db_path) as conn:
+        with pooled_connection(db_path) as conn:
             update_pipeline_state_record(
                 conn, mous_id, pre_selfcal_split_status="error"
             )
@@ -440,7 +443,8 @@ def split_mous_flow(
     log.info(f"[{mous_id}] Calibrated products: {calibrated_products}")
 
     # prepare output directory for splits
-    vm_mous_dir = Path(download_dir) / to_dir_mous_id(mous_id)
+    dir_mous_id = to_dir_mous_id(mous_id)
+    vm_mous_dir = Path(download_dir) / dir_mous_id
     log.info(f"[{mous_id}] Preparing output directory at {vm_mous_dir}...")
 
     vm_splits_dir = vm_mous_dir / "splits"
@@ -461,7 +465,7 @@ def split_mous_flow(
     )
 
     # write out the json file
-    json_path = vm_mous_dir / f"{to_dir_mous_id(mous_id)}_splits.json"
+    json_path = vm_mous_dir / f"{dir_mous_id}_splits.ndjson"
     json_write_payload(
         payload=payload,
         output_path=json_path,
@@ -471,7 +475,7 @@ def split_mous_flow(
     log.info(
         f"[{mous_id}] Updating database with split output paths: {outputvis_path_list}"
     )
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         update_pipeline_state_record(
             conn, mous_id, split_products_path=outputvis_path_list
         )
@@ -488,7 +492,7 @@ def split_mous_flow(
 
     except Exception as e:
         log.info(f"[{mous_id}] Updating database status to error")
-        with get_db_connection(db_path) as conn:
+        with pooled_connection(db_path) as conn:
             update_pipeline_state_record(
                 conn, mous_id, pre_selfcal_split_status="error"
             )
@@ -29,7 +29,7 @@ from prefect import flow, get_run_logger, task
 from prefect.deployments import run_deployment
 
 from alma_ops.config import DB_PATH
-from alma_ops.db import get_db_connection
+from alma_ops.db import pooled_connection
 
 # =====================================================================
 # Prefect Tasks
@@ -113,7 +113,7 @@ def database_monitor_flow(db_path: Optional[str] = None):
 
     # grab the entire pipeline_state table contents
     # and save as a pandas dataframe
-    with get_db_connection(db_path) as conn:
+    with pooled_connection(db_path) as conn:
         df = pd.read_sql("SELECT * FROM pipeline_state", conn)
 
     # log.info(f"Loaded Database; printing head...")
@@ -99,6 +99,10 @@ CREATE TABLE targets (
     scan_intent TEXT
 );
 
+-- covering indexes for the per-MOUS target lookups in alma_ops/db.py
+CREATE INDEX idx_targets_mous_sort ON targets(mous_id, alma_source_name, obs_id);
+CREATE INDEX idx_targets_mous_asdm ON targets(mous_id, asdm_uid);
+
 -- ===============================
 -- PIPELINE STATE (DYNAMIC)
 -- Tracks all stages of processing
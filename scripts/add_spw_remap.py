@@ -73,7 +73,7 @@ def main():
     # get pipeline state record
     with get_db_connection(DB_PATH) as conn:
         # ensure MOUS exists
-        record = get_pipeline_state_record(conn, normalized)
+        record = get_pipeline_state_record(conn, normalized, cols=("mous_id",))
         if record is None:
             log.error(f"MOUS {normalized} not found in database.")
             return
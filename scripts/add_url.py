@@ -59,7 +59,7 @@ def main():
     # connect to DB
     with get_db_connection(args.db_path) as conn:
         # Ensure MOUS exists
-        record = get_pipeline_state_record(conn, normalized)
+        record = get_pipeline_state_record(conn, normalized, cols=("mous_id",))
         if record is None:
             log.error(f"No MOUS found matching ID: {normalized}")
             return
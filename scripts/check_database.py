@@ -16,9 +16,7 @@ setup_path()
 # ---------------------------------------------------------------------
 import argparse
 
-from alma_ops.checks.listobs import check_for_listobs
-from alma_ops.checks.raw_asdms import check_for_raw_asdms
-from alma_ops.checks.split_products import check_for_split_products
+from alma_ops.checks.run_all import run_all_checks
 from alma_ops.checks.summary import summarize_results
 
 # ---------------------------------------------------------------------
@@ -55,15 +53,11 @@ if __name__ == "__main__":
 
     with get_db_connection(args.db_path) as conn:
 
-        raw = check_for_raw_asdms(
+        # raw, split and listobs checks share one pass over each MOUS directory
+        checks = run_all_checks(
             conn, args.datasets_dir, verbose=args.verbose, dry_run=args.dry_run
         )
-
-        splits = check_for_split_products(
-            conn, args.datasets_dir, verbose=args.verbose, dry_run=args.dry_run
-        )
-
-        listobs = check_for_listobs(conn, args.datasets_dir, verbose=args.verbose)
+        raw, splits, listobs = checks["raw"], checks["splits"], checks["listobs"]
 
         summarize_results(
             raw, splits, listobs, args.db_path, show_table=args.show_table
@@ -19,11 +19,11 @@ setup_path()
 # imports
 # ---------------------------------------------------------------------
 import argparse  # noqa: E402
-import sqlite3  # noqa: E402
 
 import pandas as pd  # noqa: E402
 
 from alma_ops.config import DB_PATH  # noqa: E402
+from alma_ops.db import db_transaction, get_db_connection  # noqa: E402
 from alma_ops.logging import get_logger  # noqa: E402
 
 # ---------------------------------------------------------------------
@@ -79,9 +79,13 @@ def create_db(
     log.info("✅ All required columns found!")
 
     # Connect to DB and enable foreign keys
-    conn = sqlite3.connect(database_path)
+    conn = get_db_connection(database_path)
     conn.execute("PRAGMA foreign_keys = ON;")
 
+    # the connection is in autocommit mode, so each load runs in its own
+    # db_transaction; otherwise every inserted row would be committed on its own
+    # (to_sql commits when it finishes, which closes that transaction)
+
     # --------------------------
     # Projects
     # --------------------------
@@ -103,7 +107,8 @@ def create_db(
     # Only keep those that exist in the CSV to avoid KeyError for absent optional columns
     projects_present = [c for c in projects_cols if c in df.columns]
     projects_df = df[projects_present].drop_duplicates(subset=["project_code"])
-    projects_df.to_sql("projects", conn, if_exists="append", index=False)
+    with db_transaction(conn):
+        projects_df.to_sql("projects", conn, if_exists="append", index=False)
 
     # --------------------------
     # MOUS / observations
@@ -136,7 +141,8 @@ def create_db(
     mous_present = [c for c in mous_cols if c in df.columns]
     mous_df = df[mous_present].drop_duplicates(subset=["mous_id"])
     # If the DB column is 'mous_id' (lowercase) but your schema expects 'mous_id', this will match
-    mous_df.to_sql("mous", conn, if_exists="append", index=False)
+    with db_transaction(conn):
+        mous_df.to_sql("mous", conn, if_exists="append", index=False)
 
     # --------------------------
     # Targets
@@ -191,7 +197,8 @@ def create_db(
     targets_df = df[targets_present].copy()
 
     # Ensure column order matches DB if you want (not strictly necessary)
-    targets_df.to_sql("targets", conn, if_exists="append", index=False)
+    with db_transaction(conn):
+        targets_df.to_sql("targets", conn, if_exists="append", index=False)
 
     # --------------------------
     # Pipeline State
@@ -207,10 +214,12 @@ def create_db(
     pipeline_state_df["imaging_status"] = "pending"
     pipeline_state_df["cleanup_status"] = "pending"
 
-    pipeline_state_df.to_sql("pipeline_state", conn, if_exists="append", index=False)
+    with db_transaction(conn):
+        pipeline_state_df.to_sql(
+            "pipeline_state", conn, if_exists="append", index=False
+        )
 
     # Finalize
-    conn.commit()
     conn.close()
     log.info(f"✅ Data successfully loaded into {database_path}")
 
@@ -29,10 +29,10 @@ setup_path()
 
 import argparse
 import json
-import sqlite3
 from pathlib import Path
 
 from alma_ops.config import DB_PATH
+from alma_ops.db import db_transaction, get_db_connection
 from alma_ops.logging import get_logger
 from tabulate import tabulate
 
@@ -62,26 +62,26 @@ def update_asdm_counts(conn, asdm_counts: dict):
     updates = []
     missing = []
 
-    for mous_id, count in asdm_counts.items():
-        cursor.execute("SELECT mous_id FROM mous WHERE mous_id = ?", (mous_id,))
-        result = cursor.fetchone()
-        if result:
-            cursor.execute(
-                """
-                UPDATE mous
-                SET num_asdms=?
-                WHERE mous_id=?
-                """,
-                (
-                    count,
-                    mous_id,
-                ),
-            )
-            updates.append((mous_id, count))
-        else:
-            missing.append(mous_id)
+    with db_transaction(conn):
+        for mous_id, count in asdm_counts.items():
+            cursor.execute("SELECT mous_id FROM mous WHERE mous_id = ?", (mous_id,))
+            result = cursor.fetchone()
+            if result:
+                cursor.execute(
+                    """
+                    UPDATE mous
+                    SET num_asdms=?
+                    WHERE mous_id=?
+                    """,
+                    (
+                        count,
+                        mous_id,
+                    ),
+                )
+                updates.append((mous_id, count))
+            else:
+                missing.append(mous_id)
 
-    conn.commit()
     return updates, missing
 
 
@@ -124,7 +124,7 @@ if __name__ == "__main__":
 
     json_path = Path(args.json)
 
-    with sqlite3.connect(args.db_path) as conn:
+    with get_db_connection(args.db_path) as conn:
         asdm_counts = load_asdm_metadata(json_path)
 
         if args.dry_run:
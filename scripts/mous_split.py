@@ -36,7 +36,12 @@ from canfar.sessions import Session
 # Alma Ops imports
 # ---------------------------------------------------------------------
 from alma_ops.config import CASA_IMAGE, DATASETS_DIR, DB_PATH, SRDP_WEBLOG_DIR
-from alma_ops.db import db_fetch_one, get_db_connection, get_mous_spw_mapping
+from alma_ops.db import (
+    db_fetch_one,
+    get_db_connection,
+    load_mous_target_bundle,
+    parse_json_safe,
+)
 from alma_ops.utils import to_dir_mous_id
 
 # =====================================================================
@@ -61,13 +66,20 @@ def schedule_split_for_mous(
     if not result:
         raise ValueError(f"MOUS {mous_id} not found.")
 
-    asdm_paths = json.loads(result["asdm_paths"] or "[]")
+    # decoded through the db module's (orjson-backed) JSON helper
+    asdm_paths = parse_json_safe(result["asdm_paths"]) or []
+    # a value that fails to decode comes back as the raw string; iterating it
+    # would schedule one split per character
+    if not isinstance(asdm_paths, list):
+        raise RuntimeError(
+            f"asdm_paths for {mous_id} is not a JSON list: {result['asdm_paths']!r}"
+        )
     if not asdm_paths:
         raise RuntimeError(f"No ASDMs recorded for {mous_id}.")
     log.info(f"[{mous_id}] Found {len(asdm_paths)}.")
 
-    # --- SPW map
-    spw_map = get_mous_spw_mapping(conn, mous_id)
+    # --- SPW map (per target)
+    spw_map = load_mous_target_bundle(conn, mous_id).spws_by_target
     if not spw_map:
         raise RuntimeError(f"No targets found for {mous_id}.")
     log.info(f"[{mous_id}] Found {len(spw_map)} targets.")
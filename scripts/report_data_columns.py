@@ -95,7 +95,7 @@ if __name__ == "__main__":
 
     # connect to ensure MOUS exists
     with get_db_connection(args.db_path) as conn:
-        record = get_pipeline_state_record(conn, args.mous_id)
+        record = get_pipeline_state_record(conn, args.mous_id, cols=("mous_id",))
         if record is None:
             log.error(f"MOUS {args.mous_id} not found in database.")
             exit(1)
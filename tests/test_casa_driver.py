@@ -0,0 +1,91 @@
+"""
+test_casa_driver.py
+--------------------
+Tests for the payload parsing and task dispatch of alma_ops.casa_driver.
+"""
+
+import json
+
+import pytest
+
+from alma_ops import casa_driver as driver
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Replaces the CASA tasks with recorders, returning the recorded calls."""
+    calls = []
+    for name in ("split", "listobs"):
+        monkeypatch.setattr(
+            driver,
+            name,
+            lambda _name=name, **kwargs: calls.append((_name, kwargs)),
+            raising=False,
+        )
+    return calls
+
+
+def _write_ndjson(path, records):
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+    return str(path)
+
+
+def test_iter_ndjson_tasks_skips_header_and_blank_lines(tmp_path):
+    path = tmp_path / "payload.ndjson"
+    path.write_text(
+        json.dumps({"mous_id": "uid://A/1", "db_path": "/db"})
+        + "\n\n"
+        + json.dumps({"task": "listobs", "vis": "a.ms", "listfile": "a.txt"})
+        + "\n"
+    )
+
+    tasks = list(driver.iter_ndjson_tasks(str(path)))
+
+    assert tasks == [{"task": "listobs", "vis": "a.ms", "listfile": "a.txt"}]
+
+
+def test_load_json_payload(tmp_path):
+    path = tmp_path / "payload.json"
+    path.write_text(json.dumps({"tasks": [{"task": "listobs", "vis": "a.ms"}]}))
+
+    assert driver.load_json_payload(str(path))["tasks"][0]["vis"] == "a.ms"
+
+
+def test_run_task_merges_defaults_and_drops_unknown_keys(calls, tmp_path):
+    path = _write_ndjson(
+        tmp_path / "payload.ndjson",
+        [
+            {"mous_id": "uid://A/1"},
+            {
+                "task": "split",
+                "vis": "a.ms",
+                "outputvis": "a_T.ms",
+                "field": "T",
+                "spw": "0,1",
+                "mous_id": "uid://A/1",
+            },
+            {"task": "listobs", "vis": "a.ms", "listfile": "a.txt", "verbose": False},
+        ],
+    )
+
+    for task in driver.iter_ndjson_tasks(path):
+        driver.run_task(task)
+
+    assert calls == [
+        (
+            "split",
+            {
+                "datacolumn": "data",
+                "vis": "a.ms",
+                "outputvis": "a_T.ms",
+                "field": "T",
+                "spw": "0,1",
+            },
+        ),
+        ("listobs", {"verbose": False, "vis": "a.ms", "listfile": "a.txt"}),
+    ]
+
+
+def test_run_task_rejects_unknown_task(calls):
+    with pytest.raises(KeyError):
+        driver.run_task({"task": "tclean", "vis": "a.ms"})
@@ -0,0 +1,262 @@
+"""
+test_db.py
+--------------------
+Tests for the transaction, claim, caching and batch-read invariants of alma_ops.db.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from alma_ops import db
+
+SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schemas" / "database_schema.sql"
+
+
+@pytest.fixture
+def conn(tmp_path):
+    """A connection to a fresh on-disk database built from the schema."""
+    conn = db.get_db_connection(str(tmp_path / "test.db"))
+    conn.executescript(SCHEMA_PATH.read_text())
+    # not in the schema file yet (see the ADD note there)
+    conn.execute("ALTER TABLE pipeline_state ADD COLUMN raw_data_spectral_remap TEXT")
+    yield conn
+    conn.close()
+
+
+def _add_mous(conn, mous_id: str, **fields):
+    cols = ("mous_id", *fields)
+    conn.execute(
+        f"INSERT INTO pipeline_state ({', '.join(cols)}) "
+        f"VALUES ({', '.join('?' * len(cols))})",
+        (mous_id, *fields.values()),
+    )
+
+
+def _status(conn, mous_id: str, column: str = "selfcal_status"):
+    return db.get_pipeline_state_column(conn, mous_id, column)
+
+
+# =====================================================================
+# Connections
+# =====================================================================
+
+
+def test_connection_keeps_rollback_journal(conn):
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 0
+
+
+def test_connection_leaves_wal_mode(tmp_path):
+    path = str(tmp_path / "wal.db")
+    wal_conn = db.get_db_connection(path, local_tuning=True)
+    assert wal_conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    wal_conn.close()
+    db._INITIALIZED_DB_PATHS.discard(path)
+
+    conn = db.get_db_connection(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    conn.close()
+
+
+# =====================================================================
+# db_transaction
+# =====================================================================
+
+
+def test_transaction_commits_on_success(conn):
+    with db.db_transaction(conn):
+        _add_mous(conn, "uid://A/1")
+    assert not conn.in_transaction
+    assert db.get_pipeline_state_record(conn, "uid://A/1") is not None
+
+
+def test_transaction_rolls_back_on_error(conn):
+    with pytest.raises(RuntimeError), db.db_transaction(conn):
+        _add_mous(conn, "uid://A/1")
+        raise RuntimeError("boom")
+    assert not conn.in_transaction
+    assert db.get_pipeline_state_record(conn, "uid://A/1") is None
+
+
+def test_nested_transaction_rolls_back_only_inner_block(conn):
+    with db.db_transaction(conn):
+        _add_mous(conn, "uid://A/1")
+        with pytest.raises(RuntimeError), db.db_transaction(conn):
+            _add_mous(conn, "uid://A/2")
+            raise RuntimeError("boom")
+        # the outer transaction is still open after the inner rollback
+        assert conn.in_transaction
+        _add_mous(conn, "uid://A/3")
+
+    rows = db.get_pipeline_state_records(conn, ["uid://A/1", "uid://A/2", "uid://A/3"])
+    assert sorted(rows) == ["uid://A/1", "uid://A/3"]
+
+
+def test_outer_rollback_discards_released_savepoint(conn):
+    with pytest.raises(RuntimeError), db.db_transaction(conn):
+        with db.db_transaction(conn):
+            _add_mous(conn, "uid://A/1")
+        raise RuntimeError("boom")
+    assert db.get_pipeline_state_record(conn, "uid://A/1") is None
+
+
+# =====================================================================
+# claim_mous_for_selfcal
+# =====================================================================
+
+
+def test_claim_moves_status_to_in_progress(conn):
+    _add_mous(conn, "uid://A/1", selfcal_status="prepped", mous_directory="/d")
+
+    row = db.claim_mous_for_selfcal(conn, "uid://A/1")
+
+    assert row["selfcal_status"] == "prepped"
+    assert row["mous_directory"] == "/d"
+    assert _status(conn, "uid://A/1") == "in_progress"
+    assert _status(conn, "uid://A/1", "selfcal_started_at") is not None
+
+
+def test_claim_rejects_unexpected_status(conn):
+    _add_mous(conn, "uid://A/1", selfcal_status="pending")
+
+    with pytest.raises(ValueError, match="expected 'prepped'"):
+        db.claim_mous_for_selfcal(conn, "uid://A/1")
+    assert _status(conn, "uid://A/1") == "pending"
+
+
+def test_claim_rejects_unknown_mous(conn):
+    with pytest.raises(ValueError, match="not found"):
+        db.claim_mous_for_selfcal(conn, "uid://A/404")
+
+
+def test_claim_fails_when_status_changed_before_update(conn, monkeypatch):
+    # another run claimed the MOUS after the status was read
+    _add_mous(conn, "uid://A/1", selfcal_status="in_progress")
+    monkeypatch.setattr(
+        db,
+        "get_pipeline_state_record",
+        lambda conn, mous_id, cols=None: {
+            "pre_selfcal_listobs_status": "complete",
+            "selfcal_status": "prepped",
+            "mous_directory": None,
+        },
+    )
+
+    with pytest.raises(RuntimeError, match="claimed by another run"):
+        db.claim_mous_for_selfcal(conn, "uid://A/1")
+    assert not conn.in_transaction
+
+
+def test_update_status_if_skips_changed_status(conn):
+    _add_mous(conn, "uid://A/1", download_status="downloaded")
+    _add_mous(conn, "uid://A/2", download_status="in_progress")
+
+    for mous_id in ("uid://A/1", "uid://A/2"):
+        db.update_pipeline_status_if(
+            conn, mous_id, "download_status", "error", "in_progress"
+        )
+
+    assert _status(conn, "uid://A/1", "download_status") == "downloaded"
+    assert _status(conn, "uid://A/2", "download_status") == "error"
+
+
+# =====================================================================
+# _SpwRemapCache
+# =====================================================================
+
+
+@pytest.fixture
+def spw_cache(monkeypatch):
+    """A fresh module-level SPW remap cache, so tests do not share entries."""
+    cache = db._SpwRemapCache()
+    monkeypatch.setattr(db, "_SPW_REMAP_CACHE", cache)
+    return cache
+
+
+def test_spw_remap_write_invalidates_cache(conn, spw_cache):
+    _add_mous(conn, "uid://A/1", raw_data_spectral_remap='{"1": 2}')
+    assert db.get_spw_remap(conn, "uid://A/1") == {1: 2}
+
+    db.update_pipeline_state_record(conn, "uid://A/1", raw_data_spectral_remap={3: 4})
+    assert db.get_spw_remap(conn, "uid://A/1") == {3: 4}
+
+
+def test_spw_remap_cache_serves_hits_until_invalidated(conn, spw_cache):
+    _add_mous(conn, "uid://A/1", raw_data_spectral_remap='{"1": 2}')
+    db.get_spw_remap(conn, "uid://A/1")
+
+    # a write that bypasses the module is only seen once the cache is dropped
+    conn.execute(
+        "UPDATE pipeline_state SET raw_data_spectral_remap='{\"5\": 6}' "
+        "WHERE mous_id='uid://A/1'"
+    )
+    assert db.get_spw_remap(conn, "uid://A/1") == {1: 2}
+
+    spw_cache.invalidate()
+    assert db.get_spw_remap(conn, "uid://A/1") == {5: 6}
+
+
+def test_spw_remap_cache_drops_entries_read_before_invalidation(spw_cache):
+    generation = spw_cache.generation
+    spw_cache.invalidate()
+    spw_cache.put("uid://A/1", {1: 2}, generation)
+    assert spw_cache.get("uid://A/1") == (False, None)
+
+
+def test_spw_remap_cache_expires_entries(spw_cache):
+    spw_cache.ttl = 0
+    spw_cache.put("uid://A/1", {1: 2}, spw_cache.generation)
+    assert spw_cache.get("uid://A/1") == (False, None)
+
+
+# =====================================================================
+# Batch reads and JSON values
+# =====================================================================
+
+
+def test_get_pipeline_state_records_spans_chunks(conn):
+    ids = [f"uid://A/{i}" for i in range(db._MAX_IN_PARAMS + 10)]
+    with db.db_transaction(conn):
+        for mous_id in ids[::2]:
+            _add_mous(conn, mous_id, download_status="pending")
+
+    rows = db.get_pipeline_state_records(conn, ids, cols=("download_status",))
+
+    assert sorted(rows) == sorted(ids[::2])
+    assert rows[ids[0]]["download_status"] == "pending"
+
+
+def test_select_in_sql_rejects_bad_column():
+    with pytest.raises(ValueError, match="Invalid column name"):
+        db._build_select_in_sql("pipeline_state", ("mous_id", "x; DROP"), 1)
+
+
+def test_serialize_fields_encodes_lists_and_dicts():
+    fields = db._serialize_fields(
+        {
+            "asdm_paths": ["a.asdm"],
+            "calibrated_products": '["b.ms"]',
+            "notes": {"k": 1},
+            "download_status": "complete",
+        }
+    )
+    assert db.parse_json_safe(fields["asdm_paths"]) == ["a.asdm"]
+    # already serialized values are stored as-is
+    assert fields["calibrated_products"] == '["b.ms"]'
+    assert db.parse_json_safe(fields["notes"]) == {"k": 1}
+    assert fields["download_status"] == "complete"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, None),
+        ('["a", "b"]', ["a", "b"]),
+        ('{"1": 2}', {"1": 2}),
+        ("/plain/path.ms", "/plain/path.ms"),
+        ("[not json", "[not json"),
+    ],
+)
+def test_parse_json_safe(value, expected):
+    assert db.parse_json_safe(value) == expected
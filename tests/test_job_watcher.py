@@ -0,0 +1,79 @@
+"""
+test_job_watcher.py
+--------------------
+Tests for the shared headless-session watcher in flows/mous_download.py.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("prefect")
+pytest.importorskip("canfar")
+pytest.importorskip("httpx")
+
+import mous_download
+
+
+def _run(coro):
+    return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+
+def test_watcher_resolves_terminal_statuses(monkeypatch):
+    statuses = {"job-1": "Succeeded", "job-2": "Failed"}
+    calls = []
+
+    def fake_info(ids):
+        calls.append(list(ids))
+        return [{"id": job_id, "status": statuses[job_id]} for job_id in ids]
+
+    monkeypatch.setattr(mous_download, "get_session_info", fake_info)
+
+    async def main():
+        watcher = mous_download.JobWatcher.instance()
+        results = await asyncio.gather(watcher.wait("job-1"), watcher.wait("job-2"))
+        return watcher, results
+
+    watcher, results = _run(main())
+
+    assert results == ["Succeeded", "Failed"]
+    # both jobs were polled with a single call
+    assert calls == [["job-1", "job-2"]]
+    assert not watcher._pending and not watcher._statuses
+    assert not watcher._empty_counts and not watcher._deadlines
+
+
+def test_watcher_fails_every_waiter_on_fatal_error(monkeypatch):
+    def fake_info(ids):
+        raise PermissionError("auth")
+
+    monkeypatch.setattr(mous_download, "get_session_info", fake_info)
+
+    async def main():
+        watcher = mous_download.JobWatcher.instance()
+        results = await asyncio.gather(
+            watcher.wait("job-1"), watcher.wait("job-2"), return_exceptions=True
+        )
+        return watcher, results
+
+    watcher, results = _run(main())
+
+    assert all(isinstance(r, PermissionError) for r in results)
+    assert not watcher._pending and not watcher._deadlines
+
+
+def test_watcher_fails_waiters_when_poll_loop_crashes(monkeypatch):
+    # a response without a status makes _poll itself raise
+    monkeypatch.setattr(
+        mous_download, "get_session_info", lambda ids: [{"id": "job-1"}]
+    )
+
+    async def main():
+        watcher = mous_download.JobWatcher.instance()
+        with pytest.raises(RuntimeError, match="Job watcher failed"):
+            await watcher.wait("job-1")
+        return watcher
+
+    watcher = _run(main())
+
+    assert not watcher._pending